@@ -7,28 +7,29 @@ Combines all features: Multi-TF, Weighted Confidence, Divergence Detection, Risk
 import time
 import signal
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from binance_crypto import (
-    analyze_crypto_binance,
-    generate_trade_signal,
-    get_multi_timeframe_analysis,
-    validate_signal_multi_timeframe,
-    calculate_weighted_confidence,
-    detect_divergences,
-)
-from risk_management import RiskManager, RiskProfile
+# binance_crypto (which drags in ccxt/pandas/numpy) and risk_management are
+# imported lazily inside the methods that need them, so importing this module
+# as a library stays cheap
 
 
 # Global flag for graceful shutdown
 running = True
 
+# Event used for interruptible waits between iterations - set by the signal
+# handler so a pending sleep wakes immediately instead of polling 1s at a time
+_stop = threading.Event()
+
 
 def signal_handler(sig, frame):
     """Handle CTRL+C gracefully"""
     global running
     print("\n\n🛑 Shutdown signal received. Stopping after current analysis...")
     running = False
+    _stop.set()
 
 
 class AdvancedTradingSystem:
@@ -36,6 +37,8 @@ class AdvancedTradingSystem:
     
     def __init__(self, account_balance=10000, win_rate=0.55, avg_win_loss_ratio=1.5):
         """Initialize advanced trading system"""
+        from risk_management import RiskManager, RiskProfile
+
         self.profile = RiskProfile(
             account_balance=account_balance,
             max_risk_per_trade=0.02,
@@ -47,29 +50,70 @@ class AdvancedTradingSystem:
         )
         self.risk_manager = RiskManager(self.profile)
     
-    def analyze_symbol_advanced(self, symbol, base_timeframe="5m", verbose=True):
-        """Perform complete advanced analysis on a symbol"""
+    def analyze_symbol_advanced(self, symbol, base_timeframe="5m", verbose=True, force_full=False):
+        """Perform complete advanced analysis on a symbol
+
+        When the base-timeframe signal is WAIT, the multi-timeframe fetch and
+        validation are skipped (their output would be discarded anyway) unless
+        force_full=True.
+        """
+        from binance_crypto import (
+            analyze_crypto_binance,
+            generate_trade_signal,
+            get_multi_timeframe_analysis,
+            validate_signal_multi_timeframe,
+        )
+
         if verbose:
             print(f"\n{'='*80}\nADVANCED TRADING ANALYSIS: {symbol}\n{'='*80}\n")
-            print("[1/4] Analyzing base timeframe...")
-        
-        analysis_5m = analyze_crypto_binance(symbol, timeframe=base_timeframe)
-        if not analysis_5m:
-            print("❌ Failed to fetch data")
-            return None
-        
-        if verbose:
-            print("[2/4] Generating signal...")
-        signal_5m = generate_trade_signal(analysis_5m, use_weighted_confidence=True)
-        
-        if verbose:
-            print("[3/4] Fetching multi-timeframe data...")
-        multi_tf_analyses = get_multi_timeframe_analysis(symbol, base_timeframe)
-        
+            print("[1/4] Fetching base and multi-timeframe data in parallel...")
+
+        # The base-TF and multi-TF fetches are independent network calls, so
+        # overlap them - total fetch latency drops from sum to max
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            f_base = executor.submit(analyze_crypto_binance, symbol, timeframe=base_timeframe)
+            f_multi = executor.submit(get_multi_timeframe_analysis, symbol, base_timeframe)
+
+            analysis_5m = f_base.result()
+            if not analysis_5m:
+                f_multi.cancel()
+                print("❌ Failed to fetch data")
+                return None
+
+            if verbose:
+                print("[2/4] Generating signal...")
+            signal_5m = generate_trade_signal(analysis_5m, use_weighted_confidence=True)
+
+            if signal_5m['action'] == 'WAIT' and not force_full:
+                # No actionable signal - drop the speculative multi-TF fetch
+                # (cancel is best-effort; it may already be in flight)
+                f_multi.cancel()
+                if verbose:
+                    print("[3/4] WAIT signal - skipping multi-timeframe validation")
+                return {
+                    'symbol': symbol,
+                    'base_timeframe': base_timeframe,
+                    'analysis_5m': analysis_5m,
+                    'signal_5m': signal_5m,
+                    'multi_tf_analyses': None,
+                    'multi_tf_validation': {
+                        'strength': 0,
+                        'confirmations': 0,
+                        'approved': False,
+                        'timeframes_aligned': [],
+                    },
+                    'divergences': signal_5m.get('divergences', []),
+                    'weighted_confidence': signal_5m.get('weighted_confidence', 0),
+                }
+
+            if verbose:
+                print("[3/4] Waiting for multi-timeframe data...")
+            multi_tf_analyses = f_multi.result()
+
         if verbose:
             print("[4/4] Validating across timeframes...")
         tf_validation = validate_signal_multi_timeframe(signal_5m, multi_tf_analyses)
-        
+
         return {
             'symbol': symbol,
             'base_timeframe': base_timeframe,
@@ -109,45 +153,49 @@ class AdvancedTradingSystem:
     
     def print_complete_analysis(self, analysis):
         """Print complete trading analysis"""
-        print(f"\n{'='*80}\nCOMPLETE ANALYSIS: {analysis['symbol']}\n{'='*80}\n")
-        
+        # Build the whole report in memory and emit it with a single write -
+        # one syscall per report instead of one per line
+        out = [f"\n{'='*80}\nCOMPLETE ANALYSIS: {analysis['symbol']}\n{'='*80}\n"]
+
         signal = analysis['signal_5m']
-        print(f"5M SIGNAL: {signal['action']} (Confidence: {signal['confidence']}%)")
-        print(f"Weighted Confidence: {analysis['weighted_confidence']:.1f}%\n")
-        
+        out.append(f"5M SIGNAL: {signal['action']} (Confidence: {signal['confidence']}%)")
+        out.append(f"Weighted Confidence: {analysis['weighted_confidence']:.1f}%\n")
+
         if analysis['divergences']:
-            print(f"⚠️  DIVERGENCES ({len(analysis['divergences'])}):")
+            out.append(f"⚠️  DIVERGENCES ({len(analysis['divergences'])}):")
             for div in analysis['divergences']:
-                print(f"  - {div['type']}: {div['description']}")
-            print()
-        
+                out.append(f"  - {div['type']}: {div['description']}")
+            out.append("")
+
         tf_val = analysis['multi_tf_validation']
-        print(f"MULTI-TIMEFRAME VALIDATION:")
-        print(f"  Strength: {tf_val['strength']:.0f}%")
-        print(f"  Confirmations: {tf_val['confirmations']}/3")
-        print(f"  Approved: {'✅ YES' if tf_val['approved'] else '❌ NO'}")
+        out.append("MULTI-TIMEFRAME VALIDATION:")
+        out.append(f"  Strength: {tf_val['strength']:.0f}%")
+        out.append(f"  Confirmations: {tf_val['confirmations']}/3")
+        out.append(f"  Approved: {'✅ YES' if tf_val['approved'] else '❌ NO'}")
         if tf_val['timeframes_aligned']:
-            print(f"  Aligned: {', '.join(tf_val['timeframes_aligned'])}")
-        
-        print(f"\nRISK ASSESSMENT:")
+            out.append(f"  Aligned: {', '.join(tf_val['timeframes_aligned'])}")
+
+        out.append("\nRISK ASSESSMENT:")
         entry = signal.get('entry') or 0
         stop_loss = signal.get('stop_loss') or 0
-        print(f"  Entry: ${entry:.8f}")
-        print(f"  Stop: ${stop_loss:.8f}")
+        out.append(f"  Entry: ${entry:.8f}")
+        out.append(f"  Stop: ${stop_loss:.8f}")
         if entry > 0 and stop_loss > 0:
             risk_pct = abs((stop_loss - entry) / entry * 100)
-            print(f"  Risk: {risk_pct:.3f}%")
+            out.append(f"  Risk: {risk_pct:.3f}%")
         rr = signal.get('risk_reward') or 0
-        print(f"  R:R: 1:{rr:.2f}")
-        
-        print(f"\n{'='*80}")
+        out.append(f"  R:R: 1:{rr:.2f}")
+
+        out.append(f"\n{'='*80}")
         if tf_val['approved'] and signal['action'] != 'WAIT':
-            print("✅ STRONG SIGNAL - Multi-TF Confirmed")
+            out.append("✅ STRONG SIGNAL - Multi-TF Confirmed")
         elif signal['action'] != 'WAIT':
-            print("⚠️  WEAK SIGNAL - Consider higher TF entry")
+            out.append("⚠️  WEAK SIGNAL - Consider higher TF entry")
         else:
-            print("⏸️  NO CLEAR SIGNAL")
-        print(f"{'='*80}\n")
+            out.append("⏸️  NO CLEAR SIGNAL")
+        out.append(f"{'='*80}\n")
+
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def get_risk_report(self):
         """Get risk management report"""
@@ -241,11 +289,10 @@ def main(continuous=False, interval=60, symbol="LAB/USDT:USDT", base_timeframe="
                 print(f"\n⏳ Waiting {interval} seconds until next analysis...")
                 print(f"   (Press CTRL+C to stop)")
 
-                # Sleep in small increments to allow quick response to CTRL+C
-                for _ in range(interval):
-                    if not running:
-                        break
-                    time.sleep(1)
+                # Single interruptible wait - the signal handler sets _stop,
+                # so this returns immediately on CTRL+C with zero idle wakeups
+                if _stop.wait(timeout=interval):
+                    break
 
         print("\n✅ Monitoring stopped successfully.")
     else:
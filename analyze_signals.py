@@ -5,73 +5,194 @@ Signal Analysis Tool - Check if TP or SL was hit first
 
 import ccxt
 import re
+import sys
+import numpy as np
+import requests
+from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache
+from numba import njit
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
-# Initialize exchanges
-bybit = ccxt.bybit({'enableRateLimit': True})
-mexc = ccxt.mexc({'enableRateLimit': True})
+# Symbols routed to bybit; everything else goes to mexc. frozenset gives
+# O(1) membership instead of a list scan per signal.
+_BYBIT_PAIRS = frozenset({'ADA/USDT:USDT', 'AVAX/USDT:USDT', 'ICP/USDT:USDT', 'IRYS/USDT:USDT'})
+
+
+@cache
+def _get_exchange(exchange_id):
+    """Lazy singleton ccxt client - session setup is deferred to first use.
+
+    Each client gets a requests.Session with a widened keep-alive pool so
+    concurrent fetches reuse TLS connections instead of handshaking per call.
+    """
+    exchange = getattr(ccxt, exchange_id)({'enableRateLimit': True})
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    exchange.session = session
+    return exchange
+
+# Precompiled patterns - parse_signals runs these on every line
+_RE_DIR = re.compile(r'(🟢|🔴) \*(LONG|SHORT) ([A-Z]+/USDT:USDT)\*')
+_RE_PRICE = re.compile(r'`([\d.]+)`')
+_RE_TIME = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+# Single alternation over all field markers - one scan through the line
+# instead of one substring search per field
+_RE_FIELD = re.compile(r'(Entry|Stop Loss|Take Profit):|(⏰)')
+_FIELD_KEYS = {'Entry': 'entry', 'Stop Loss': 'stop_loss', 'Take Profit': 'take_profit'}
+
+# Result codes returned by _first_hit
+_NO_HIT = 0
+_SL_HIT = 1
+_TP_HIT = 2
+
+# Columnar (SoA) layout for analyzed results - lets the summary use
+# vectorized masks/sums instead of list comprehensions over dicts
+_RESULT_DTYPE = np.dtype([
+    ('symbol', 'U32'),
+    ('direction', 'U5'),
+    ('entry', 'f8'),
+    ('sl', 'f8'),
+    ('tp', 'f8'),
+    ('pnl', 'f8'),
+    ('result', 'u1'),
+])
+_RESULT_CODES = {'TP HIT': 0, 'SL HIT': 1, 'OPEN': 2, 'ERROR': 3}
+
+
+def results_to_array(results):
+    """Pack analyzed signal dicts into a NumPy structured array"""
+    return np.fromiter(
+        (
+            (
+                r['symbol'],
+                r['direction'],
+                r['entry'],
+                r['stop_loss'],
+                r['take_profit'],
+                r['analysis'].get('pnl_pct', 0.0),
+                _RESULT_CODES.get(r['analysis']['result'], _RESULT_CODES['ERROR']),
+            )
+            for r in results
+        ),
+        dtype=_RESULT_DTYPE,
+        count=len(results),
+    )
+
+
+try:
+    # Prefer the AOT-compiled kernel (built via `python build_aot.py`) -
+    # no JIT warm-up cost at process start
+    from first_hit_mod import first_hit as _first_hit
+except ImportError:
+    @njit('Tuple((i8,i4,f8,f8))(f8[:,:],f8,f8,f8,b1)', cache=True)
+    def _first_hit(arr, entry, sl, tp, is_long):
+        """Scan candles for the first SL/TP touch.
+
+        Returns (index, result_code, hit_price, pnl_pct); result_code 0 means
+        neither level was hit. SL is checked before TP within the same candle,
+        matching the original per-candle scan order.
+        """
+        for i in range(arr.shape[0]):
+            high = arr[i, 2]
+            low = arr[i, 3]
+            if is_long:
+                if low <= sl:
+                    return i, _SL_HIT, sl, ((sl - entry) / entry) * 100
+                if high >= tp:
+                    return i, _TP_HIT, tp, ((tp - entry) / entry) * 100
+            else:
+                if high >= sl:
+                    return i, _SL_HIT, sl, ((entry - sl) / entry) * -100
+                if low <= tp:
+                    return i, _TP_HIT, tp, ((entry - tp) / entry) * 100
+        return -1, _NO_HIT, 0.0, 0.0
+
+    # Warm the JIT cache at import so the first real signal doesn't pay compile time
+    _first_hit(np.zeros((1, 6), dtype=np.float64), 1.0, 0.5, 2.0, True)
+
 
 def parse_signals(filepath):
     """Parse signals from telegram export text file"""
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-
     signals = []
     current_signal = {}
 
-    for i, line in enumerate(lines):
-        # Detect start of trade signal
-        direction_match = re.search(r'(🟢|🔴) \*(LONG|SHORT) ([A-Z]+/USDT:USDT)\*', line)
-        if direction_match:
-            # Start new signal
-            current_signal = {
-                'direction': direction_match.group(2),
-                'symbol': direction_match.group(3)
-            }
-            continue
-
-        # Extract entry price
-        if '💰 Entry:' in line or 'Entry:' in line:
-            entry_match = re.search(r'`([\d.]+)`', line)
-            if entry_match:
-                current_signal['entry'] = float(entry_match.group(1))
-
-        # Extract stop loss
-        if '🛑 Stop Loss:' in line or 'Stop Loss:' in line:
-            sl_match = re.search(r'`([\d.]+)`', line)
-            if sl_match:
-                current_signal['stop_loss'] = float(sl_match.group(1))
-
-        # Extract take profit
-        if '🎯 Take Profit:' in line or 'Take Profit:' in line:
-            tp_match = re.search(r'`([\d.]+)`', line)
-            if tp_match:
-                current_signal['take_profit'] = float(tp_match.group(1))
-
-        # Extract timestamp
-        if '⏰' in line:
-            time_match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-            if time_match and current_signal:
-                current_signal['timestamp'] = time_match.group(1)
-
-                # Check if we have all required fields
-                if all(k in current_signal for k in ['symbol', 'direction', 'entry', 'stop_loss', 'take_profit', 'timestamp']):
-                    signals.append(current_signal.copy())
-                    current_signal = {}
+    # Stream the file instead of materializing every line up front - one
+    # forward pass, one line in memory at a time
+    with open(filepath, 'r', buffering=1 << 16) as f:
+        for line in f:
+            # Detect start of trade signal
+            direction_match = _RE_DIR.search(line)
+            if direction_match:
+                # Start new signal
+                current_signal = {
+                    'direction': direction_match.group(2),
+                    'symbol': direction_match.group(3)
+                }
+                continue
+
+            # Dispatch on a single field-marker scan instead of one
+            # substring search per field
+            field_match = _RE_FIELD.search(line)
+            if not field_match:
+                continue
+
+            if field_match.group(1):
+                # Price level line (entry / stop loss / take profit)
+                price_match = _RE_PRICE.search(line)
+                if price_match:
+                    current_signal[_FIELD_KEYS[field_match.group(1)]] = float(price_match.group(1))
+
+            else:
+                # Timestamp line
+                time_match = _RE_TIME.search(line)
+                if time_match and current_signal:
+                    # Parse once here - downstream consumers want a datetime,
+                    # and re-running strptime per trade later is wasted work
+                    current_signal['timestamp'] = datetime.strptime(
+                        time_match.group(1), '%Y-%m-%d %H:%M:%S'
+                    )
+
+                    # Check if we have all required fields
+                    if all(k in current_signal for k in ['symbol', 'direction', 'entry', 'stop_loss', 'take_profit', 'timestamp']):
+                        # Append the dict itself - rebinding below gives us a
+                        # fresh one, so no defensive copy is needed
+                        signals.append(current_signal)
+                        current_signal = {}
 
     return signals
 
 
 def get_exchange_for_symbol(symbol):
     """Determine which exchange to use for a symbol"""
-    bybit_pairs = ['ADA/USDT:USDT', 'AVAX/USDT:USDT', 'ICP/USDT:USDT', 'IRYS/USDT:USDT']
+    return _get_exchange('bybit' if symbol in _BYBIT_PAIRS else 'mexc')
 
-    if symbol in bybit_pairs:
-        return bybit
-    else:
-        return mexc
+
+# One 15m candle in milliseconds - used to bucket `since` so signals that
+# land in the same candle share one cached fetch
+_CANDLE_MS = 15 * 60 * 1000
+
+
+@lru_cache(maxsize=512)
+def _fetch_ohlcv_cached(exchange_id, symbol, timeframe, since_bucket):
+    """Fetch OHLCV once per (exchange, symbol, timeframe, candle bucket).
+
+    Returns a tuple-of-tuples so the result is hashable and immutable;
+    callers convert back with np.asarray.
+    """
+    exchange = _get_exchange(exchange_id)
+    candles = exchange.fetch_ohlcv(symbol, timeframe, since=since_bucket, limit=200)
+    return tuple(tuple(c) for c in candles) if candles else ()
 
 
 def analyze_signal(signal):
@@ -82,81 +203,69 @@ def analyze_signal(signal):
     entry = signal['entry']
     sl = signal['stop_loss']
     tp = signal['take_profit']
-    entry_time = datetime.strptime(signal['timestamp'], '%Y-%m-%d %H:%M:%S')
+    entry_time = signal['timestamp']
 
     # Get exchange
     exchange = get_exchange_for_symbol(symbol)
 
+    # Fetch candles from entry time onwards (15m timeframe), cached per
+    # candle bucket so overlapping signals reuse one network call. Only the
+    # network call can legitimately fail, so only it sits inside try/except.
+    since = int(entry_time.timestamp() * 1000)
+    since_bucket = since // _CANDLE_MS * _CANDLE_MS
     try:
-        # Fetch candles from entry time onwards (15m timeframe)
-        since = int(entry_time.timestamp() * 1000)
-        candles = exchange.fetch_ohlcv(symbol, '15m', since=since, limit=200)
+        candles = _fetch_ohlcv_cached(exchange.id, symbol, '15m', since_bucket)
+    except ccxt.BaseError as e:
+        return {
+            'result': 'ERROR',
+            'error': str(e)
+        }
 
-        if not candles:
-            return None
+    if not candles:
+        return None
 
-        # Check each candle
-        for candle in candles:
-            timestamp, open_price, high, low, close, volume = candle
-            candle_time = datetime.fromtimestamp(timestamp / 1000)
+    arr = np.asarray(candles, dtype=np.float64)
+    is_long = direction == 'LONG'
 
-            if direction == 'LONG':
-                # Check if SL hit (low went below SL)
-                if low <= sl:
-                    return {
-                        'result': 'SL HIT',
-                        'hit_time': candle_time,
-                        'hit_price': sl,
-                        'pnl_pct': ((sl - entry) / entry) * 100
-                    }
-                # Check if TP hit (high went above TP)
-                elif high >= tp:
-                    return {
-                        'result': 'TP HIT',
-                        'hit_time': candle_time,
-                        'hit_price': tp,
-                        'pnl_pct': ((tp - entry) / entry) * 100
-                    }
-
-            elif direction == 'SHORT':
-                # Check if SL hit (high went above SL)
-                if high >= sl:
-                    return {
-                        'result': 'SL HIT',
-                        'hit_time': candle_time,
-                        'hit_price': sl,
-                        'pnl_pct': ((entry - sl) / entry) * -100
-                    }
-                # Check if TP hit (low went below TP)
-                elif low <= tp:
-                    return {
-                        'result': 'TP HIT',
-                        'hit_time': candle_time,
-                        'hit_price': tp,
-                        'pnl_pct': ((entry - tp) / entry) * 100
-                    }
-
-        # Neither hit yet - check current price
-        current = candles[-1][4]  # Close price
-
-        if direction == 'LONG':
-            current_pnl = ((current - entry) / entry) * 100
-        else:
-            current_pnl = ((entry - current) / entry) * 100
+    # Cheap SIMD min/max reduction first: if neither level was ever touched
+    # anywhere in the window, skip the first-hit scan entirely and fall
+    # straight through to the OPEN path
+    max_high = arr[:, 2].max()
+    min_low = arr[:, 3].min()
+    if is_long:
+        never_hit = min_low > sl and max_high < tp
+    else:
+        never_hit = max_high < sl and min_low > tp
 
-        return {
-            'result': 'OPEN',
-            'hit_time': None,
-            'hit_price': current,
-            'pnl_pct': current_pnl
-        }
+    if never_hit:
+        code = _NO_HIT
+    else:
+        # First-hit scan runs in a compiled Numba kernel (single native pass)
+        idx, code, hit_price, pnl_pct = _first_hit(arr, entry, sl, tp, is_long)
 
-    except Exception as e:
+    if code != _NO_HIT:
         return {
-            'result': 'ERROR',
-            'error': str(e)
+            'result': 'SL HIT' if code == _SL_HIT else 'TP HIT',
+            'hit_time': datetime.fromtimestamp(arr[idx, 0] / 1000),
+            'hit_price': hit_price,
+            'pnl_pct': pnl_pct
         }
 
+    # Neither hit yet - check current price
+    current = candles[-1][4]  # Close price
+
+    if direction == 'LONG':
+        current_pnl = ((current - entry) / entry) * 100
+    else:
+        current_pnl = ((entry - current) / entry) * 100
+
+    return {
+        'result': 'OPEN',
+        'hit_time': None,
+        'hit_price': current,
+        'pnl_pct': current_pnl
+    }
+
 
 def main():
     print("\n" + "="*100)
@@ -170,13 +279,31 @@ def main():
     print(f"📊 Found {len(signals)} signals to analyze\n")
     print("Analyzing...\n")
 
-    # Analyze each signal
-    results = []
+    # Analyze signals concurrently - the work is network-bound, so overlapping
+    # fetch_ohlcv calls amortizes the per-signal round-trip. ccxt's rate
+    # limiter is per-exchange instance and thread-safe.
+    analyses = [None] * len(signals)
 
-    for i, signal in enumerate(signals, 1):
-        print(f"[{i}/{len(signals)}] {signal['symbol']} {signal['direction']}...", end=" ", flush=True)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = {
+            executor.submit(analyze_signal, signal): idx
+            for idx, signal in enumerate(signals)
+        }
+        done = 0
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                analyses[idx] = future.result()
+            except ccxt.BaseError as e:
+                analyses[idx] = {'result': 'ERROR', 'error': str(e)}
+            done += 1
+            print(f"[{done}/{len(signals)}] analyzed", end="\r", flush=True)
+
+    print()
 
-        analysis = analyze_signal(signal)
+    results = []
+    for i, (signal, analysis) in enumerate(zip(signals, analyses), 1):
+        print(f"[{i}/{len(signals)}] {signal['symbol']} {signal['direction']}...", end=" ", flush=True)
 
         if analysis:
             signal['analysis'] = analysis
@@ -193,49 +320,59 @@ def main():
         else:
             print("❌ Failed")
 
-    # Summary
-    print("\n" + "="*100)
-    print("📊 ANALYSIS RESULTS")
-    print("="*100 + "\n")
+    # Summary - built in memory and emitted as one write
+    out = ["\n" + "="*100, "📊 ANALYSIS RESULTS", "="*100 + "\n"]
+
+    results_arr = results_to_array(results)
+    tp_n = int((results_arr['result'] == _RESULT_CODES['TP HIT']).sum())
+    sl_n = int((results_arr['result'] == _RESULT_CODES['SL HIT']).sum())
+    open_n = int((results_arr['result'] == _RESULT_CODES['OPEN']).sum())
+    closed_n = tp_n + sl_n
 
-    tp_hits = [r for r in results if r['analysis']['result'] == 'TP HIT']
-    sl_hits = [r for r in results if r['analysis']['result'] == 'SL HIT']
-    open_trades = [r for r in results if r['analysis']['result'] == 'OPEN']
+    out.append(f"✅ TP Hit: {tp_n}")
+    out.append(f"❌ SL Hit: {sl_n}")
+    out.append(f"🔄 Still Open: {open_n}")
+    out.append(f"📊 Total Analyzed: {len(results)}")
 
-    print(f"✅ TP Hit: {len(tp_hits)}")
-    print(f"❌ SL Hit: {len(sl_hits)}")
-    print(f"🔄 Still Open: {len(open_trades)}")
-    print(f"📊 Total Analyzed: {len(results)}")
+    if closed_n > 0:
+        win_rate = (tp_n / closed_n) * 100
+        out.append(f"\n🎯 Win Rate: {win_rate:.1f}%")
 
-    if len(tp_hits) + len(sl_hits) > 0:
-        win_rate = (len(tp_hits) / (len(tp_hits) + len(sl_hits))) * 100
-        print(f"\n🎯 Win Rate: {win_rate:.1f}%")
+    # Calculate total PnL over closed trades in one vectorized pass
+    closed_mask = results_arr['result'] <= _RESULT_CODES['SL HIT']
+    total_pnl = float(results_arr['pnl'][closed_mask].sum())
+    if closed_n > 0:
+        avg_pnl = total_pnl / closed_n
+        out.append(f"💰 Average PnL per Trade: {avg_pnl:+.2f}%")
+        out.append(f"💵 Total PnL (Closed): {total_pnl:+.2f}%")
 
-    # Calculate total PnL
-    total_pnl = sum([r['analysis']['pnl_pct'] for r in results if r['analysis']['result'] in ['TP HIT', 'SL HIT']])
-    if tp_hits or sl_hits:
-        avg_pnl = total_pnl / (len(tp_hits) + len(sl_hits))
-        print(f"💰 Average PnL per Trade: {avg_pnl:+.2f}%")
-        print(f"💵 Total PnL (Closed): {total_pnl:+.2f}%")
+    sys.stdout.write('\n'.join(out) + '\n')
 
     # Detailed results
     print("\n" + "="*100)
     print("📋 DETAILED RESULTS")
     print("="*100 + "\n")
 
-    # Group by symbol
-    by_symbol = {}
+    # Group and count per symbol in a single pass over results instead of
+    # one list comprehension per outcome per symbol
+    by_symbol = defaultdict(lambda: {'tp': 0, 'sl': 0, 'open': 0, 'trades': []})
     for r in results:
-        sym = r['symbol']
-        if sym not in by_symbol:
-            by_symbol[sym] = []
-        by_symbol[sym].append(r)
+        stats = by_symbol[r['symbol']]
+        stats['trades'].append(r)
+        res = r['analysis']['result']
+        if res == 'TP HIT':
+            stats['tp'] += 1
+        elif res == 'SL HIT':
+            stats['sl'] += 1
+        elif res == 'OPEN':
+            stats['open'] += 1
 
     for symbol in sorted(by_symbol.keys()):
-        trades = by_symbol[symbol]
-        tp_count = len([t for t in trades if t['analysis']['result'] == 'TP HIT'])
-        sl_count = len([t for t in trades if t['analysis']['result'] == 'SL HIT'])
-        open_count = len([t for t in trades if t['analysis']['result'] == 'OPEN'])
+        stats = by_symbol[symbol]
+        trades = stats['trades']
+        tp_count = stats['tp']
+        sl_count = stats['sl']
+        open_count = stats['open']
 
         if tp_count + sl_count > 0:
             symbol_wr = (tp_count / (tp_count + sl_count)) * 100
@@ -244,13 +381,12 @@ def main():
 
             for trade in trades:
                 a = trade['analysis']
-                entry_time = trade['timestamp']
 
                 if a['result'] == 'TP HIT':
-                    time_diff = a['hit_time'] - datetime.strptime(entry_time, '%Y-%m-%d %H:%M:%S')
+                    time_diff = a['hit_time'] - trade['timestamp']
                     print(f"    ✅ {trade['direction']} @ {trade['entry']:.6f} → TP {trade['take_profit']:.6f} | +{a['pnl_pct']:.2f}% | {time_diff}")
                 elif a['result'] == 'SL HIT':
-                    time_diff = a['hit_time'] - datetime.strptime(entry_time, '%Y-%m-%d %H:%M:%S')
+                    time_diff = a['hit_time'] - trade['timestamp']
                     print(f"    ❌ {trade['direction']} @ {trade['entry']:.6f} → SL {trade['stop_loss']:.6f} | {a['pnl_pct']:.2f}% | {time_diff}")
                 elif a['result'] == 'OPEN':
                     print(f"    🔄 {trade['direction']} @ {trade['entry']:.6f} → Current {a['hit_price']:.6f} | {a['pnl_pct']:+.2f}%")
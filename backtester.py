@@ -9,21 +9,126 @@ Backtester - Historical replay using ccxt data and SBST + lightweight signal rul
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import isnan
+from pathlib import Path
 from typing import Dict, List, Optional
 
+import ccxt
+import numpy as np
 import pandas as pd
 
-from binance_crypto import (
-    get_binance_data,
-    generate_trade_signal_simple,
-)
+try:
+    # Optional columnar backend: rechunked Polars columns give contiguous
+    # zero-copy NumPy views for the bar loop
+    import polars as pl
+except ImportError:
+    pl = None
+
+from binance_crypto import get_binance_data
 from super_buy_sell_trend import calculate_super_buy_sell_trend
-from indicators import (
-    calculate_rsi,
-    calculate_macd,
-    calculate_moving_averages,
-    calculate_adx,
-)
+from indicators_fused import compute_all
+
+
+# On-disk OHLCV cache - repeat backtests read a local parquet file instead of
+# hitting the exchange again
+_OHLCV_CACHE_DIR = Path('.ohlcv_cache')
+
+
+def get_ohlcv_cached(symbol: str, timeframe: str = "5m", limit: int = 500) -> Optional[pd.DataFrame]:
+    """get_binance_data with a local parquet cache.
+
+    When the cached history is deep enough and its last bar is still fresh,
+    the exchange is skipped entirely; otherwise new data is fetched, merged
+    into the cache and written back.
+    """
+    _OHLCV_CACHE_DIR.mkdir(exist_ok=True)
+    path = _OHLCV_CACHE_DIR / f"{symbol.replace('/', '_').replace(':', '_')}_{timeframe}.parquet"
+
+    cached = None
+    if path.exists():
+        try:
+            cached = pd.read_parquet(path)
+        except Exception:
+            cached = None
+
+    bar_seconds = ccxt.Exchange.parse_timeframe(timeframe)
+    if cached is not None and len(cached) >= limit:
+        age = pd.Timestamp.now(tz='UTC').tz_localize(None) - cached.index[-1]
+        if age.total_seconds() < 2 * bar_seconds:
+            return cached.iloc[-limit:].copy()
+
+    df = get_binance_data(symbol, timeframe=timeframe, limit=limit)
+    if df is None:
+        # Network failure - serve stale history if we have any
+        return cached.iloc[-limit:].copy() if cached is not None and len(cached) else None
+
+    if cached is not None:
+        df = pd.concat([cached, df])
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+    try:
+        df.to_parquet(path, engine='pyarrow', compression='zstd')
+    except Exception:
+        pass  # cache write is best-effort
+    return df.iloc[-limit:].copy()
+
+
+def signals_vectorized(
+    cols: Dict,
+    rsi_low: float = 45,
+    rsi_high: float = 65,
+    adx_min: float = 20,
+    require_macd: bool = True,
+):
+    """Vectorized port of generate_trade_signal_simple over column arrays.
+
+    Evaluates every rule predicate as one boolean array and the entry/stop/TP
+    levels as float arrays for all bars at once. NaN indicator values are
+    treated as 0, matching the scalar rules' `analysis.get(...) or 0`.
+
+    Returns (action, entry, stop, tp1) where action is int8: +1 BUY, -1 SELL,
+    0 WAIT. The scalar generate_trade_signal_simple stays as-is for the live
+    analyzers.
+    """
+    rsi = np.nan_to_num(cols['RSI'])
+    adx = np.nan_to_num(cols['ADX_14'])
+    macd_hist = np.nan_to_num(cols['MACDh_12_26_9'])
+
+    trend_up = cols['trend'] == 1
+    aligned = trend_up == (cols['trendx'] == 1)
+    rsi_ok = (rsi >= rsi_low) & (rsi <= rsi_high)
+    adx_ok = adx >= adx_min
+    if require_macd:
+        macd_buy_ok = macd_hist > 0
+        macd_sell_ok = macd_hist < 0
+    else:
+        macd_buy_ok = macd_sell_ok = np.ones(len(rsi), dtype=bool)
+
+    buy_mask = aligned & trend_up & macd_buy_ok & rsi_ok & adx_ok
+    sell_mask = aligned & ~trend_up & macd_sell_ok & rsi_ok & adx_ok
+
+    price = cols['Close']
+    atr = np.nan_to_num(cols['atr'])
+    atr_ok = atr > 0
+
+    # BUY: SBST support below entry, else ATR fallback (NaN levels propagate,
+    # exactly as the scalar rules leave them)
+    up = cols['up_level']
+    buy_fallback = price - np.where(atr_ok, atr, np.abs(price) * 0.005)
+    buy_stop = np.where((up >= price) | (up <= 0), buy_fallback, up)
+    buy_tp1 = price + np.where(atr_ok, atr * 1.5, np.abs(price) * 0.01)
+
+    # SELL: SBST resistance above entry, else ATR fallback
+    dn = cols['dn_level']
+    sell_fallback = price + np.where(atr_ok, atr, np.abs(price) * 0.005)
+    sell_stop = np.where(dn <= price, sell_fallback, dn)
+    sell_tp1 = price - np.where(atr_ok, atr * 1.5, np.abs(price) * 0.01)
+
+    action = np.zeros(len(price), dtype=np.int8)
+    action[buy_mask] = 1
+    action[sell_mask] = -1
+    stop = np.where(buy_mask, buy_stop, sell_stop)
+    tp1 = np.where(buy_mask, buy_tp1, sell_tp1)
+    return action, price, stop, tp1
 
 
 @dataclass
@@ -40,6 +145,75 @@ class TradeResult:
     pnl_pct: float
 
 
+class TradeLog:
+    """Columnar (SoA) trade storage.
+
+    Trades are written as scalars into preallocated parallel arrays; summary
+    stats become single NumPy reductions instead of per-trade comprehensions.
+    Indexing and iteration reconstruct TradeResult views lazily so callers
+    that print `trades[-5:]` keep working.
+    """
+
+    EXIT_NAMES = ('TIME', 'TP1', 'SL')
+    EXIT_CODES = {name: code for code, name in enumerate(EXIT_NAMES)}
+
+    def __init__(self, capacity: int = 0):
+        self.n = 0
+        self.index = np.empty(capacity, dtype=np.int64)
+        self.date = np.empty(capacity, dtype='datetime64[ns]')
+        self.action = np.empty(capacity, dtype='U4')
+        self.entry = np.empty(capacity)
+        self.stop = np.empty(capacity)
+        self.tp1 = np.empty(capacity)
+        self.exit = np.empty(capacity)
+        self.exit_reason = np.empty(capacity, dtype=np.int8)
+        self.pnl = np.empty(capacity)
+        self.pnl_pct = np.empty(capacity)
+
+    def append(self, index, date, action, entry, stop, tp1, exit_price, exit_reason, pnl, pnl_pct):
+        i = self.n
+        self.index[i] = index
+        self.date[i] = np.datetime64(date)
+        self.action[i] = action
+        self.entry[i] = entry
+        self.stop[i] = stop
+        self.tp1[i] = tp1
+        self.exit[i] = exit_price
+        self.exit_reason[i] = self.EXIT_CODES[exit_reason]
+        self.pnl[i] = pnl
+        self.pnl_pct[i] = pnl_pct
+        self.n = i + 1
+
+    def _view(self, i: int) -> TradeResult:
+        return TradeResult(
+            index=int(self.index[i]),
+            date=pd.Timestamp(self.date[i]),
+            action=str(self.action[i]),
+            entry=float(self.entry[i]),
+            stop=float(self.stop[i]),
+            tp1=float(self.tp1[i]),
+            exit=float(self.exit[i]),
+            exit_reason=self.EXIT_NAMES[self.exit_reason[i]],
+            pnl=float(self.pnl[i]),
+            pnl_pct=float(self.pnl_pct[i]),
+        )
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._view(i) for i in range(*key.indices(self.n))]
+        if key < 0:
+            key += self.n
+        if not 0 <= key < self.n:
+            raise IndexError('trade index out of range')
+        return self._view(key)
+
+    def __iter__(self):
+        return (self._view(i) for i in range(self.n))
+
+
 class Backtester:
     """Backtest trading signals on historical data"""
 
@@ -52,12 +226,17 @@ class Backtester:
         rsi_high: float = 70,
         adx_min: float = 15,
         require_macd: bool = True,
+        use_polars: bool = True,
     ):
         self.symbol = symbol
         self.lookback_days = lookback_days
         self.timeframe = timeframe
-        self.trades: List[TradeResult] = []
+        self.use_polars = bool(use_polars and pl is not None)
+        self.trades = TradeLog()
         self.summary: Dict = {}
+        # Price buffers bound by backtest() for the trade simulator
+        self._high = self._low = self._close = None
+        self._timestamps = None
         self.rule_params = {
             'rsi_low': rsi_low,
             'rsi_high': rsi_high,
@@ -68,13 +247,32 @@ class Backtester:
     def _prepare_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         # Core set used by generate_trade_signal_simple
         df = calculate_super_buy_sell_trend(df, periods=10, multiplier1=0.8, multiplier2=1.6)
-        df = calculate_rsi(df)
-        df = calculate_macd(df)
-        df = calculate_moving_averages(df, periods=[10, 20, 50])
-        df = calculate_adx(df)
+
+        # RSI/MACD/MAs/ADX come out of one fused Numba pass over the OHLC
+        # arrays instead of four separate pandas_ta invocations
+        fused = compute_all(
+            df['High'].to_numpy(dtype=np.float64),
+            df['Low'].to_numpy(dtype=np.float64),
+            df['Close'].to_numpy(dtype=np.float64),
+        )
+        for name, arr in fused.items():
+            df[name] = arr
+
+        # Precompute per-bar derived columns once so the bar loop does plain
+        # positional reads instead of O(window) slices per bar
+        for c in ['buy_signal', 'sell_signal', 'buy_confirm', 'sell_confirm']:
+            df[f'recent_{c}'] = df[c].astype(bool).rolling(5, min_periods=1).max().astype(bool)
+        df['price_change_5c'] = df['Close'].pct_change(5) * 100
         return df
 
     def _first_valid_index(self, df: pd.DataFrame) -> int:
+        """First bar position where every required indicator is populated.
+
+        Always returns an integer position (argmax on the boolean mask,
+        len(df) when nothing qualifies) - no label round-trip through
+        idxmax()/index.get_loc(), so downstream start-index arithmetic
+        stays purely positional.
+        """
         # Ensure required columns are populated
         req = [
             "RSI",
@@ -86,189 +284,242 @@ class Backtester:
             "trend",
             "trendx",
         ]
-        valid = df[req].notna().all(axis=1)
-        if not valid.any():
+        # Column-wise AND of NaN masks - avoids allocating an 8-column
+        # DataFrame just to find one positional index
+        mask = np.ones(len(df), dtype=bool)
+        for c in req:
+            mask &= ~np.isnan(df[c].to_numpy(dtype=np.float64))
+        if not mask.any():
             return len(df)
-        # Get the first label where all requirements are non-NaN
-        first_label = valid.idxmax()
-        # Convert label to positional index
-        try:
-            loc = df.index.get_loc(first_label)
-            if isinstance(loc, slice):
-                return loc.start or 0
-            return int(loc)
-        except Exception:
-            # Fallback to last warm index
-            return max(0, len(df) - 1)
-
-    def _build_analysis_at(self, df: pd.DataFrame, i: int) -> Optional[Dict]:
+        return int(mask.argmax())
+
+    # Columns extracted to ndarrays for the bar loop
+    _ANALYSIS_COLS = [
+        'High', 'Low',
+        'Close', 'price_change_5c', 'trend', 'trendx',
+        'buy_signal', 'sell_signal', 'buy_confirm', 'sell_confirm',
+        'recent_buy_signal', 'recent_sell_signal',
+        'recent_buy_confirm', 'recent_sell_confirm',
+        'up_level', 'dn_level', 'upx_level', 'dnx_level',
+        'RSI', 'MACD_12_26_9', 'MACDs_12_26_9', 'MACDh_12_26_9',
+        'ADX_14', 'EMA_10', 'EMA_20', 'SMA_50', 'atr',
+    ]
+
+    def _extract_columns(self, df: pd.DataFrame) -> Dict:
+        """Pull every column the bar loop needs out as ndarrays, once.
+
+        With Polars available, columns go through an Arrow-backed frame whose
+        rechunked buffers give contiguous (usually zero-copy) NumPy views.
+        The pandas fallback consolidates everything into one column-major
+        float32 matrix and hands out per-column row views of it.
+        """
+        if self.use_polars:
+            pldf = pl.from_pandas(df[self._ANALYSIS_COLS], rechunk=True)
+            return {name: pldf[name].to_numpy() for name in self._ANALYSIS_COLS}
+        mat = np.ascontiguousarray(df[self._ANALYSIS_COLS].to_numpy(dtype=np.float32).T)
+        return {name: mat[k] for k, name in enumerate(self._ANALYSIS_COLS)}
+
+    @staticmethod
+    def _opt(value) -> Optional[float]:
+        """float(value), or None when NaN"""
+        return None if isnan(value) else float(value)
+
+    def _build_analysis_at(self, cols: Dict, timestamps, i: int) -> Optional[Dict]:
         if i <= 5:
             return None
-        latest = df.iloc[i]
-        # Recent windows within computed history up to i
-        window_start = max(0, i - 4)
-        recent_buy = df['buy_signal'].iloc[window_start:i + 1].any()
-        recent_sell = df['sell_signal'].iloc[window_start:i + 1].any()
-        recent_buy_confirm = df['buy_confirm'].iloc[window_start:i + 1].any()
-        recent_sell_confirm = df['sell_confirm'].iloc[window_start:i + 1].any()
-
-        trend = 'UPTREND' if latest['trend'] == 1 else 'DOWNTREND'
-        trend_confirmed = 'UPTREND' if latest['trendx'] == 1 else 'DOWNTREND'
+
+        # Cheap predicate gates first: most bars are WAITs, so skip the
+        # ~22-field dict build whenever the rule thresholds already fail
+        adx = cols['ADX_14'][i]
+        if isnan(adx) or adx < self.rule_params['adx_min']:
+            return None
+        if not (cols['recent_buy_signal'][i] or cols['recent_sell_signal'][i]):
+            return None
+
+        # Plain ndarray reads - no per-bar Series allocation or label lookups
+        trend = 'UPTREND' if cols['trend'][i] == 1 else 'DOWNTREND'
+        trend_confirmed = 'UPTREND' if cols['trendx'][i] == 1 else 'DOWNTREND'
         trend_aligned = trend == trend_confirmed
 
+        atr = cols['atr'][i]
         analysis = {
             'symbol': self.symbol,
             'timeframe': self.timeframe,
-            'timestamp': latest.name,
-            'price': float(latest['Close']),
-            'price_change_5c': float(((latest['Close'] - df['Close'].iloc[max(0, i - 5)]) / df['Close'].iloc[max(0, i - 5)]) * 100),
+            'timestamp': timestamps[i],
+            'price': float(cols['Close'][i]),
+            'price_change_5c': float(cols['price_change_5c'][i]),
 
             'trend': trend,
             'trend_confirmed': trend_confirmed,
             'trend_aligned': trend_aligned,
-            'current_buy_signal': bool(latest['buy_signal']),
-            'current_sell_signal': bool(latest['sell_signal']),
-            'current_buy_confirm': bool(latest['buy_confirm']),
-            'current_sell_confirm': bool(latest['sell_confirm']),
-            'recent_buy': bool(recent_buy),
-            'recent_sell': bool(recent_sell),
-            'recent_buy_confirm': bool(recent_buy_confirm),
-            'recent_sell_confirm': bool(recent_sell_confirm),
-
-            'up_level': float(latest['up_level']),
-            'dn_level': float(latest['dn_level']),
-            'upx_level': float(latest['upx_level']),
-            'dnx_level': float(latest['dnx_level']),
-
-            'rsi': float(latest.get('RSI')) if pd.notna(latest.get('RSI')) else None,
-            'macd': float(latest.get('MACD_12_26_9')) if pd.notna(latest.get('MACD_12_26_9')) else None,
-            'macd_signal': float(latest.get('MACDs_12_26_9')) if pd.notna(latest.get('MACDs_12_26_9')) else None,
-            'macd_hist': float(latest.get('MACDh_12_26_9')) if pd.notna(latest.get('MACDh_12_26_9')) else None,
-            'adx': float(latest.get('ADX_14')) if pd.notna(latest.get('ADX_14')) else None,
-            'ema_10': float(latest.get('EMA_10')) if pd.notna(latest.get('EMA_10')) else None,
-            'ema_20': float(latest.get('EMA_20')) if pd.notna(latest.get('EMA_20')) else None,
-            'sma_50': float(latest.get('SMA_50')) if pd.notna(latest.get('SMA_50')) else None,
-            'atr': float(latest['atr']) if pd.notna(latest.get('atr')) else 0.0,
+            'current_buy_signal': bool(cols['buy_signal'][i]),
+            'current_sell_signal': bool(cols['sell_signal'][i]),
+            'current_buy_confirm': bool(cols['buy_confirm'][i]),
+            'current_sell_confirm': bool(cols['sell_confirm'][i]),
+            'recent_buy': bool(cols['recent_buy_signal'][i]),
+            'recent_sell': bool(cols['recent_sell_signal'][i]),
+            'recent_buy_confirm': bool(cols['recent_buy_confirm'][i]),
+            'recent_sell_confirm': bool(cols['recent_sell_confirm'][i]),
+
+            'up_level': float(cols['up_level'][i]),
+            'dn_level': float(cols['dn_level'][i]),
+            'upx_level': float(cols['upx_level'][i]),
+            'dnx_level': float(cols['dnx_level'][i]),
+
+            'rsi': self._opt(cols['RSI'][i]),
+            'macd': self._opt(cols['MACD_12_26_9'][i]),
+            'macd_signal': self._opt(cols['MACDs_12_26_9'][i]),
+            'macd_hist': self._opt(cols['MACDh_12_26_9'][i]),
+            'adx': self._opt(cols['ADX_14'][i]),
+            'ema_10': self._opt(cols['EMA_10'][i]),
+            'ema_20': self._opt(cols['EMA_20'][i]),
+            'sma_50': self._opt(cols['SMA_50'][i]),
+            'atr': float(atr) if not isnan(atr) else 0.0,
         }
         return analysis
 
-    def _simulate_trade(self, df: pd.DataFrame, i: int, signal: Dict, lookahead: int = 20) -> Optional[TradeResult]:
+    def _vectorized_backtest(self, df, cols, start_idx) -> None:
+        """Run the backtest off the vectorized signal arrays.
+
+        All rule predicates and trade levels are computed in one batch; the
+        Python loop only visits the (sparse) bars that produced a signal.
+        """
+        action, entry, stop, tp1 = signals_vectorized(cols, **self.rule_params)
+        candidate_idx = np.nonzero(action != 0)[0]
+
+        # At most one trade per candidate bar
+        self.trades = TradeLog(capacity=len(candidate_idx))
+
+        for i in candidate_idx:
+            i = int(i)
+            # Respect lookback/warmup and keep lookahead room
+            if i <= 5 or i < start_idx or i >= len(df) - 1:
+                continue
+            signal = {
+                'action': 'BUY' if action[i] == 1 else 'SELL',
+                'entry': entry[i],
+                'stop_loss': stop[i],
+                'take_profit_1': tp1[i],
+            }
+            self._simulate_trade(i, signal, lookahead=20)
+
+    def _simulate_trade(self, i: int, signal: Dict, lookahead: int = 20) -> bool:
         action = signal['action']
         if action not in ['BUY', 'SELL']:
-            return None
+            return False
 
         entry = float(signal['entry'])
         stop = float(signal['stop_loss'])
         tp1 = float(signal['take_profit_1'])
 
-        end = min(len(df) - 1, i + lookahead)
-        exit_price = entry
-        exit_reason = 'TIME'
-
-        for j in range(i + 1, end + 1):
-            high = float(df['High'].iloc[j])
-            low = float(df['Low'].iloc[j])
-            if action == 'BUY':
-                # SL first, then TP to be conservative
-                if low <= stop:
-                    exit_price = stop
-                    exit_reason = 'SL'
-                    break
-                if high >= tp1:
-                    exit_price = tp1
-                    exit_reason = 'TP1'
-                    break
-            else:  # SELL
-                if high >= stop:
-                    exit_price = stop
-                    exit_reason = 'SL'
-                    break
-                if low <= tp1:
-                    exit_price = tp1
-                    exit_reason = 'TP1'
-                    break
+        end = min(len(self._close) - 1, i + lookahead)
+
+        # Vectorized first-hit scan over the lookahead window - boolean masks
+        # plus argmax replace the per-bar pandas .iloc loop. The price arrays
+        # were bound to the instance once in backtest(), so the tight loop
+        # touches bare numpy buffers only.
+        hs = self._high[i + 1:end + 1]
+        ls = self._low[i + 1:end + 1]
+        if action == 'BUY':
+            sl_hit = ls <= stop
+            tp_hit = hs >= tp1
+        else:  # SELL
+            sl_hit = hs >= stop
+            tp_hit = ls <= tp1
+
+        n_win = len(hs)
+        sl_idx = int(sl_hit.argmax()) if sl_hit.any() else n_win
+        tp_idx = int(tp_hit.argmax()) if tp_hit.any() else n_win
+
+        # SL first on ties, matching the conservative per-bar ordering
+        if sl_idx <= tp_idx and sl_idx < n_win:
+            exit_price = stop
+            exit_reason = 'SL'
+        elif tp_idx < n_win:
+            exit_price = tp1
+            exit_reason = 'TP1'
         else:
             # No hit within window; exit at last close
-            exit_price = float(df['Close'].iloc[end])
+            exit_price = float(self._close[end])
             exit_reason = 'TIME'
 
         pnl = (exit_price - entry) if action == 'BUY' else (entry - exit_price)
         pnl_pct = (pnl / entry) * 100 if entry != 0 else 0.0
 
-        return TradeResult(
-            index=i,
-            date=df.index[i],
-            action=action,
-            entry=entry,
-            stop=stop,
-            tp1=tp1,
-            exit=exit_price,
-            exit_reason=exit_reason,
-            pnl=pnl,
-            pnl_pct=pnl_pct,
-        )
+        # Write straight into the columnar log - no per-trade object build
+        self.trades.append(i, self._timestamps[i], action, entry, stop, tp1, exit_price, exit_reason, pnl, pnl_pct)
+        return True
 
-    def backtest(self) -> Optional[Dict]:
+    def backtest(self, df: Optional[pd.DataFrame] = None) -> Optional[Dict]:
         print(f"\n{'='*80}")
         print(f"BACKTEST: {self.symbol} ({self.lookback_days}d @ {self.timeframe})")
         print(f"{'='*80}\n")
 
-        # 1) Fetch OHLCV (extra bars for indicator warmup)
+        # 1) Fetch OHLCV (extra bars for indicator warmup) unless the caller
+        # already has a frame (e.g. a cached one from compare_strategies)
         warmup = 200
-        try:
-            print(f"[1/4] Fetching data...")
-            df = get_binance_data(self.symbol, timeframe=self.timeframe, limit=self.lookback_days + warmup)
-            if df is None or len(df) < 100:
-                print("❌ Insufficient data")
+        if df is None:
+            try:
+                print(f"[1/4] Fetching data...")
+                df = get_ohlcv_cached(self.symbol, timeframe=self.timeframe, limit=self.lookback_days + warmup)
+            except Exception as e:
+                print(f"❌ Error fetching data: {e}")
                 return None
-        except Exception as e:
-            print(f"❌ Error fetching data: {e}")
+        else:
+            print(f"[1/4] Using provided data...")
+            df = df.copy()
+        if df is None or len(df) < 100:
+            print("❌ Insufficient data")
             return None
 
         # 2) Compute indicators once
         print(f"[2/4] Computing indicators...")
         df = self._prepare_indicators(df)
 
+        # Downcast to float32: halves memory traffic for the vectorized scans
+        # and is ample precision for backtest comparisons
+        float_cols = df.select_dtypes('float64').columns
+        df[float_cols] = df[float_cols].astype('float32')
+
         # 3) Evaluate signals per bar and simulate outcomes
         print(f"[3/4] Generating signals and simulating trades...")
         start_idx = self._first_valid_index(df)
         start_idx = max(start_idx, len(df) - self.lookback_days)  # restrict to requested lookback
 
-        for i in range(start_idx, len(df) - 1):  # avoid last bar for lookahead
-            analysis = self._build_analysis_at(df, i)
-            if not analysis:
-                continue
-            # Relaxed thresholds to increase signal frequency in backtests
-            signal = generate_trade_signal_simple(
-                analysis,
-                rsi_low=self.rule_params['rsi_low'],
-                rsi_high=self.rule_params['rsi_high'],
-                adx_min=self.rule_params['adx_min'],
-                require_macd=self.rule_params['require_macd'],
-            )
-            trade = self._simulate_trade(df, i, signal, lookahead=20)
-            if trade:
-                self.trades.append(trade)
-
-        # 4) Summarize
+        # One extraction pass; price arrays are views into the same storage,
+        # bound to the instance so _simulate_trade reads bare buffers
+        cols = self._extract_columns(df)
+        self._high = cols['High']
+        self._low = cols['Low']
+        self._close = cols['Close']
+        # datetime64 values, converted once - no per-trade Timestamp boxing
+        self._timestamps = df.index.to_numpy()
+
+        self._vectorized_backtest(df, cols, start_idx)
+
+        # 4) Summarize - single NumPy reductions over the columnar trade log
         print(f"[4/4] Calculating results...")
-        wins = [t for t in self.trades if t.pnl > 0]
-        losses = [t for t in self.trades if t.pnl < 0]
         total = len(self.trades)
-        win_rate = (len(wins) / total * 100) if total else 0.0
-        avg_pnl_pct = sum(t.pnl_pct for t in self.trades) / total if total else 0.0
+        pnl = self.trades.pnl[:total]
+        pnl_pct = self.trades.pnl_pct[:total]
+        exit_codes = self.trades.exit_reason[:total]
+
+        wins = int((pnl > 0).sum())
+        losses = int((pnl < 0).sum())
+        win_rate = (wins / total * 100) if total else 0.0
+        avg_pnl_pct = float(pnl_pct.mean()) if total else 0.0
 
         self.summary = {
             'symbol': self.symbol,
             'timeframe': self.timeframe,
             'period_days': self.lookback_days,
             'trades': total,
-            'wins': len(wins),
-            'losses': len(losses),
+            'wins': wins,
+            'losses': losses,
             'win_rate_pct': round(win_rate, 2),
             'avg_pnl_pct': round(avg_pnl_pct, 3),
-            'tp_hits': sum(1 for t in self.trades if t.exit_reason == 'TP1'),
-            'sl_hits': sum(1 for t in self.trades if t.exit_reason == 'SL'),
+            'tp_hits': int((exit_codes == TradeLog.EXIT_CODES['TP1']).sum()),
+            'sl_hits': int((exit_codes == TradeLog.EXIT_CODES['SL']).sum()),
         }
 
         print("\n✅ Backtest Complete!")
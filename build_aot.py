@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+AOT build for the analyze_signals first-hit kernel
+
+Run `python build_aot.py` once to produce a `first_hit_mod` extension module.
+analyze_signals.py picks it up automatically and skips the Numba JIT warm-up
+on every process start; without it, the @njit(cache=True) fallback is used.
+"""
+
+from numba.pycc import CC
+
+cc = CC('first_hit_mod')
+
+
+@cc.export('first_hit', 'Tuple((i8,i4,f8,f8))(f8[:,:],f8,f8,f8,b1)')
+def first_hit(arr, entry, sl, tp, is_long):
+    """Same semantics as analyze_signals._first_hit (codes: 0 none, 1 SL, 2 TP)"""
+    for i in range(arr.shape[0]):
+        high = arr[i, 2]
+        low = arr[i, 3]
+        if is_long:
+            if low <= sl:
+                return i, 1, sl, ((sl - entry) / entry) * 100
+            if high >= tp:
+                return i, 2, tp, ((tp - entry) / entry) * 100
+        else:
+            if high >= sl:
+                return i, 1, sl, ((entry - sl) / entry) * -100
+            if low <= tp:
+                return i, 2, tp, ((entry - tp) / entry) * 100
+    return -1, 0, 0.0, 0.0
+
+
+if __name__ == '__main__':
+    cc.compile()
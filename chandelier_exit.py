@@ -6,94 +6,133 @@ Professional stop-loss and reversal indicator using ATR and highest/lowest
 """
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
+from numba import njit, types
 
+# pandas .to_numpy() often hands out readonly views, so input arrays are
+# declared readonly in the pinned signatures
+_RO_F8 = types.Array(types.float64, 1, 'C', readonly=True)
 
-def calculate_chandelier_exit(df, length=22, mult=3.0, use_close=True):
-    """
-    Calculate Chandelier Exit indicator
-    
-    Args:
-        df: DataFrame with OHLC data
-        length: ATR period (default 22)
-        mult: ATR multiplier (default 3.0)
-        use_close: Use close price for extremums (default True)
-    
-    Returns:
-        DataFrame with Chandelier Exit columns
+
+@njit(types.Tuple((types.float64[:], types.float64[:], types.int64[:], types.boolean[:], types.boolean[:]))(
+    _RO_F8, _RO_F8, _RO_F8, _RO_F8, _RO_F8, types.int64, types.float64), cache=True)
+def _ce_kernel(high, low, close, ext_hi_src, ext_lo_src, length, mult):
+    """Fused chandelier pass: true range, Wilder ATR, rolling extrema and the
+    stop/direction recurrence in one cache-friendly loop.
+
+    ATR uses a cumulative-mean warmup before switching to Wilder smoothing.
+    Rolling extrema over `ext_hi_src`/`ext_lo_src` are maintained with
+    monotonic index deques (O(1) amortized per bar).
+    Returns (long_stop, short_stop, direction, buy_signal, sell_signal).
     """
-    df = df.copy()
-    
-    # Calculate ATR
-    atr = mult * ta.atr(df['High'], df['Low'], df['Close'], length=length)
-    
-    n = len(df)
+    n = len(close)
     long_stop = np.zeros(n)
     short_stop = np.zeros(n)
-    direction = np.zeros(n, dtype=int)
-    
-    # Initialize
-    direction[0] = 1
-    
+    direction = np.zeros(n, dtype=np.int64)
+    buy_signal = np.zeros(n, dtype=np.bool_)
+    sell_signal = np.zeros(n, dtype=np.bool_)
+
+    maxq = np.empty(n, dtype=np.int64)
+    minq = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+    atr = 0.0
+
     for i in range(n):
-        # Calculate highest and lowest
-        if i < length:
-            if use_close:
-                highest = df['Close'].iloc[:i+1].max()
-                lowest = df['Close'].iloc[:i+1].min()
-            else:
-                highest = df['High'].iloc[:i+1].max()
-                lowest = df['Low'].iloc[:i+1].min()
-        else:
-            if use_close:
-                highest = df['Close'].iloc[i-length+1:i+1].max()
-                lowest = df['Close'].iloc[i-length+1:i+1].min()
-            else:
-                highest = df['High'].iloc[i-length+1:i+1].max()
-                lowest = df['Low'].iloc[i-length+1:i+1].min()
-        
-        # Calculate stops
-        long_stop_temp = highest - atr.iloc[i]
-        short_stop_temp = lowest + atr.iloc[i]
-        
-        # Apply previous stop rules
-        if i > 0:
-            long_stop_prev = long_stop[i-1]
-            short_stop_prev = short_stop[i-1]
-            
-            # Long stop can't go lower
-            long_stop[i] = max(long_stop_temp, long_stop_prev) if df['Close'].iloc[i-1] > long_stop_prev else long_stop_temp
-            
-            # Short stop can't go higher
-            short_stop[i] = min(short_stop_temp, short_stop_prev) if df['Close'].iloc[i-1] < short_stop_prev else short_stop_temp
-        else:
-            long_stop[i] = long_stop_temp
-            short_stop[i] = short_stop_temp
-        
-        # Determine direction
+        # True range + Wilder EMA recurrence
         if i == 0:
-            direction[i] = 1
+            tr = high[0] - low[0]
+            atr = tr
         else:
+            tr = max(high[i] - low[i], abs(high[i] - close[i-1]), abs(low[i] - close[i-1]))
+            k = i + 1 if i + 1 < length else length
+            atr += (tr - atr) / k
+        band = mult * atr
+
+        # Rolling max over the last `length` bars
+        while max_tail > max_head and ext_hi_src[maxq[max_tail-1]] <= ext_hi_src[i]:
+            max_tail -= 1
+        maxq[max_tail] = i
+        max_tail += 1
+        if maxq[max_head] <= i - length:
+            max_head += 1
+        highest = ext_hi_src[maxq[max_head]]
+
+        # Rolling min over the last `length` bars
+        while min_tail > min_head and ext_lo_src[minq[min_tail-1]] >= ext_lo_src[i]:
+            min_tail -= 1
+        minq[min_tail] = i
+        min_tail += 1
+        if minq[min_head] <= i - length:
+            min_head += 1
+        lowest = ext_lo_src[minq[min_head]]
+
+        long_stop_temp = highest - band
+        short_stop_temp = lowest + band
+
+        if i > 0:
             long_stop_prev = long_stop[i-1]
             short_stop_prev = short_stop[i-1]
-            
-            if df['Close'].iloc[i] > short_stop_prev:
+
+            # Long stop can't go lower / short stop can't go higher
+            if close[i-1] > long_stop_prev:
+                long_stop[i] = max(long_stop_temp, long_stop_prev)
+            else:
+                long_stop[i] = long_stop_temp
+            if close[i-1] < short_stop_prev:
+                short_stop[i] = min(short_stop_temp, short_stop_prev)
+            else:
+                short_stop[i] = short_stop_temp
+
+            # Direction flips when close crosses the opposite stop
+            if close[i] > short_stop_prev:
                 direction[i] = 1
-            elif df['Close'].iloc[i] < long_stop_prev:
+            elif close[i] < long_stop_prev:
                 direction[i] = -1
             else:
                 direction[i] = direction[i-1]
+
+            if direction[i] == 1 and direction[i-1] == -1:
+                buy_signal[i] = True
+            elif direction[i] == -1 and direction[i-1] == 1:
+                sell_signal[i] = True
+        else:
+            long_stop[i] = long_stop_temp
+            short_stop[i] = short_stop_temp
+            direction[i] = 1
+
+    return long_stop, short_stop, direction, buy_signal, sell_signal
+
+
+def calculate_chandelier_exit(df, length=22, mult=3.0, use_close=True):
+    """
+    Calculate Chandelier Exit indicator
     
-    # Detect signals
-    buy_signal = np.zeros(n, dtype=bool)
-    sell_signal = np.zeros(n, dtype=bool)
-    
-    for i in range(1, n):
-        if direction[i] == 1 and direction[i-1] == -1:
-            buy_signal[i] = True
-        if direction[i] == -1 and direction[i-1] == 1:
-            sell_signal[i] = True
+    Args:
+        df: DataFrame with OHLC data
+        length: ATR period (default 22)
+        mult: ATR multiplier (default 3.0)
+        use_close: Use close price for extremums (default True)
     
+    Returns:
+        DataFrame with Chandelier Exit columns
+    """
+    df = df.copy()
+
+    high_arr = df['High'].to_numpy(dtype=np.float64)
+    low_arr = df['Low'].to_numpy(dtype=np.float64)
+    close_arr = df['Close'].to_numpy(dtype=np.float64)
+    if use_close:
+        ext_hi_src = ext_lo_src = close_arr
+    else:
+        ext_hi_src = high_arr
+        ext_lo_src = low_arr
+
+    # ATR, rolling extrema and the stop/direction recurrence all run in a
+    # single fused kernel pass over the OHLC arrays
+    long_stop, short_stop, direction, buy_signal, sell_signal = _ce_kernel(
+        high_arr, low_arr, close_arr, ext_hi_src, ext_lo_src, length, float(mult)
+    )
+
     # Add to dataframe
     df['ce_long_stop'] = long_stop
     df['ce_short_stop'] = short_stop
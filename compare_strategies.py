@@ -5,11 +5,58 @@ Compare simple vs complex signal generation with backtesting
 """
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
 from backtester import Backtester
 from binance_crypto import get_binance_data, analyze_crypto_simple, generate_trade_signal_simple
 from advanced_trading_system import AdvancedTradingSystem
 
 
+# Process-local OHLCV cache so repeated compare runs against the same
+# (symbol, timeframe, limit) skip the network fetch entirely
+_OHLCV_CACHE = {}
+
+
+def _get_binance_data_cached(symbol, timeframe, limit):
+    """get_binance_data with memoization; callers get a private copy"""
+    key = (symbol, timeframe, limit)
+    df = _OHLCV_CACHE.get(key)
+    if df is None:
+        df = get_binance_data(symbol, timeframe=timeframe, limit=limit)
+        if df is not None:
+            _OHLCV_CACHE[key] = df
+    return df.copy() if df is not None else None
+
+
+def _run_backtest(symbol, kwargs):
+    """Worker entry point for backtest_many (must be module-level to pickle)"""
+    return Backtester(symbol, **kwargs).backtest()
+
+
+def backtest_many(symbols, max_workers=None, **kwargs):
+    """Backtest a universe of symbols in parallel, one process per symbol.
+
+    Each Backtester run is independent (no shared state; the parquet cache
+    uses one file per symbol/timeframe), so a process pool scales near
+    linearly with cores. Returns a DataFrame of per-symbol summaries.
+    """
+    summaries = {}
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(_run_backtest, s, kwargs): s for s in symbols}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                summaries[symbol] = future.result()
+            except Exception as e:
+                print(f"❌ Backtest failed for {symbol}: {e}")
+
+    rows = [summaries[s] for s in symbols if summaries.get(s)]
+    return pd.DataFrame(rows)
+
+
 def backtest_simple(symbol, lookback_days=180, timeframe="5m"):
     """Backtest using generate_trade_signal_simple()"""
     print("\n" + "="*80)
@@ -26,7 +73,9 @@ def backtest_simple(symbol, lookback_days=180, timeframe="5m"):
         require_macd=True
     )
 
-    results = backtester.backtest()
+    # Fetch through the cache (same warmup padding the backtester would use)
+    df = _get_binance_data_cached(symbol, timeframe, lookback_days + 200)
+    results = backtester.backtest(df=df)
 
     if results and backtester.trades:
         print(f"\n📊 SIMPLE STRATEGY RESULTS")
@@ -3,26 +3,50 @@
 Crypto Trading Signal Generator
 Uses SuperBuySellTrend + Technical Indicators for intraday crypto trading
 """
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import yfinance as yf
 import pandas as pd
 from super_buy_sell_trend import calculate_super_buy_sell_trend
 from indicators import calculate_rsi, calculate_macd, calculate_moving_averages, calculate_adx
 
 
+# Indicator column names interned once - hot scans over many symbols reuse
+# the same key objects for every dict lookup
+_RSI, _MACD, _MACDS, _MACDH, _ADX, _EMA10, _EMA20, _SMA50 = map(
+    sys.intern,
+    ('RSI', 'MACD_12_26_9', 'MACDs_12_26_9', 'MACDh_12_26_9',
+     'ADX_14', 'EMA_10', 'EMA_20', 'SMA_50'),
+)
+
+# yf.Ticker objects keep per-symbol session state; reuse them across calls
+_TICKER_CACHE = {}
+
+# Completed analyses keyed by (symbol, interval, params, last bar timestamp):
+# a polling loop that wakes before a new candle closes gets the cached
+# answer instead of recomputing the whole indicator stack
+_ANALYSIS_CACHE = {}
+_ANALYSIS_CACHE_MAX = 512
+
+
 def get_crypto_data(symbol, interval="5m", period="5d"):
     """
     Fetch crypto data for analysis
-    
+
     Args:
         symbol: Crypto symbol (e.g., 'APR-USD' for yfinance format)
         interval: Timeframe ('1m', '5m', '15m', '1h', '4h', '1d')
         period: Lookback period ('1d', '5d', '1mo', '3mo')
-    
+
     Returns:
         DataFrame with OHLCV data
     """
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = _TICKER_CACHE.get(symbol)
+        if ticker is None:
+            ticker = _TICKER_CACHE[symbol] = yf.Ticker(symbol)
         df = ticker.history(period=period, interval=interval)
         return df
     except Exception as e:
@@ -30,10 +54,46 @@ def get_crypto_data(symbol, interval="5m", period="5d"):
         return None
 
 
-def analyze_crypto_signal(symbol, interval="5m", periods=10, multiplier1=0.8, multiplier2=1.6):
+def get_crypto_data_batch(symbols, interval="5m", period="5d"):
+    """
+    Fetch OHLCV for many symbols in one threaded yf.download call
+
+    A single download issues the HTTP requests concurrently, so wall time
+    is roughly one round trip instead of one per symbol.
+
+    Returns:
+        Dict of symbol -> DataFrame (symbols with no data are omitted)
+    """
+    symbols = list(symbols)
+    try:
+        data = yf.download(tickers=symbols, period=period, interval=interval,
+                           group_by='ticker', threads=True, progress=False)
+    except Exception as e:
+        print(f"Error batch fetching {len(symbols)} symbols: {e}")
+        return {}
+
+    if data is None or data.empty:
+        return {}
+    if len(symbols) == 1:
+        return {symbols[0]: data}
+
+    result = {}
+    available = set(data.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol in available:
+            df = data[symbol].dropna(how='all')
+            if len(df):
+                result[symbol] = df
+    return result
+
+
+def analyze_crypto_signal(symbol, interval="5m", periods=10, multiplier1=0.8, multiplier2=1.6, df=None):
     """
     Generate comprehensive trading signal for crypto
-    
+
+    Pass a preloaded OHLCV frame via `df` (e.g. from get_crypto_data_batch)
+    to skip the per-symbol fetch.
+
     Returns:
         Dict with signal analysis
     """
@@ -41,16 +101,23 @@ def analyze_crypto_signal(symbol, interval="5m", periods=10, multiplier1=0.8, mu
     print(f"CRYPTO ANALYSIS: {symbol}")
     print(f"Timeframe: {interval}")
     print(f"{'='*80}\n")
-    
-    # Fetch data
-    df = get_crypto_data(symbol, interval=interval, period="5d")
-    
+
+    # Fetch data unless the caller already has it
+    if df is None:
+        df = get_crypto_data(symbol, interval=interval, period="5d")
+
     if df is None or len(df) < 200:
         print("❌ Insufficient data for analysis")
         return None
-    
+
     print(f"✓ Loaded {len(df)} candles\n")
-    
+
+    # Same symbol, same parameters, no new candle -> same answer
+    cache_key = (symbol, interval, periods, multiplier1, multiplier2, df.index[-1])
+    cached = _ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
     # Calculate SBST
     df = calculate_super_buy_sell_trend(df, periods=periods, 
                                         multiplier1=multiplier1, 
@@ -62,22 +129,24 @@ def analyze_crypto_signal(symbol, interval="5m", periods=10, multiplier1=0.8, mu
     df = calculate_moving_averages(df, periods=[10, 20, 50])
     df = calculate_adx(df)
     
-    # Get latest values
-    latest = df.iloc[-1]
-    prev = df.iloc[-2]
-    prev_5 = df.iloc[-6] if len(df) >= 6 else df.iloc[0]
-    
-    # Check for recent signals
-    recent_buy = df['buy_signal'].iloc[-5:].any()
-    recent_sell = df['sell_signal'].iloc[-5:].any()
-    recent_buy_confirm = df['buy_confirm'].iloc[-5:].any()
-    recent_sell_confirm = df['sell_confirm'].iloc[-5:].any()
+    # Get latest values as plain dicts - one pandas row extraction each,
+    # then every field read below is a C-level dict lookup
+    timestamp = df.index[-1]
+    latest = df.iloc[-1].to_dict()
+    prev_5 = (df.iloc[-6] if len(df) >= 6 else df.iloc[0]).to_dict()
+
+    # Check for recent signals - tail scans on raw bool arrays rather than
+    # per-column Series slices
+    recent_buy = bool(df['buy_signal'].to_numpy()[-5:].any())
+    recent_sell = bool(df['sell_signal'].to_numpy()[-5:].any())
+    recent_buy_confirm = bool(df['buy_confirm'].to_numpy()[-5:].any())
+    recent_sell_confirm = bool(df['sell_confirm'].to_numpy()[-5:].any())
     
     # Current signal
-    current_buy = latest['buy_signal']
-    current_sell = latest['sell_signal']
-    current_buy_confirm = latest['buy_confirm']
-    current_sell_confirm = latest['sell_confirm']
+    current_buy = bool(latest['buy_signal'])
+    current_sell = bool(latest['sell_signal'])
+    current_buy_confirm = bool(latest['buy_confirm'])
+    current_sell_confirm = bool(latest['sell_confirm'])
     
     # Price momentum
     price_change_5candles = ((latest['Close'] - prev_5['Close']) / prev_5['Close']) * 100
@@ -91,7 +160,7 @@ def analyze_crypto_signal(symbol, interval="5m", periods=10, multiplier1=0.8, mu
     analysis = {
         'symbol': symbol,
         'timeframe': interval,
-        'timestamp': latest.name,
+        'timestamp': timestamp,
         'price': latest['Close'],
         'price_change_5c': price_change_5candles,
         
@@ -115,18 +184,54 @@ def analyze_crypto_signal(symbol, interval="5m", periods=10, multiplier1=0.8, mu
         'dnx_level': latest['dnx_level'],
         
         # Technical indicators
-        'rsi': latest.get('RSI'),
-        'macd': latest.get('MACD_12_26_9'),
-        'macd_signal': latest.get('MACDs_12_26_9'),
-        'macd_hist': latest.get('MACDh_12_26_9'),
-        'adx': latest.get('ADX_14'),
-        'ema_10': latest.get('EMA_10'),
-        'ema_20': latest.get('EMA_20'),
-        'sma_50': latest.get('SMA_50'),
+        'rsi': latest.get(_RSI),
+        'macd': latest.get(_MACD),
+        'macd_signal': latest.get(_MACDS),
+        'macd_hist': latest.get(_MACDH),
+        'adx': latest.get(_ADX),
+        'ema_10': latest.get(_EMA10),
+        'ema_20': latest.get(_EMA20),
+        'sma_50': latest.get(_SMA50),
         'atr': latest['atr'],
     }
-    
-    return analysis
+
+    if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX:
+        _ANALYSIS_CACHE.clear()
+    _ANALYSIS_CACHE[cache_key] = analysis
+    return dict(analysis)
+
+
+def _analyze_symbol(symbol, interval, df):
+    """Worker entry point for analyze_many (must be module-level to pickle)"""
+    return analyze_crypto_signal(symbol, interval=interval, df=df)
+
+
+def analyze_many(symbols, interval="5m", period="5d", max_workers=None):
+    """Analyze a universe of symbols in parallel, one process per symbol.
+
+    Data comes from one threaded batch download up front; the CPU-bound
+    indicator phase then fans out across cores, which the GIL would
+    otherwise serialize. Returns a dict of symbol -> analysis (symbols with
+    no data or a failed analysis are omitted).
+    """
+    data = get_crypto_data_batch(symbols, interval=interval, period=period)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(_analyze_symbol, s, interval, data[s]): s
+            for s in symbols if s in data
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                analysis = future.result()
+            except Exception as e:
+                print(f"❌ Analysis failed for {symbol}: {e}")
+                continue
+            if analysis:
+                results[symbol] = analysis
+    return results
 
 
 def generate_trade_signal(analysis):
@@ -256,72 +361,80 @@ def generate_trade_signal(analysis):
     return signal
 
 
-def print_analysis(analysis, signal):
-    """Print formatted analysis and trade signal"""
-    
-    print("📊 MARKET DATA")
-    print("-" * 80)
-    print(f"Price: ${analysis['price']:.6f}")
-    print(f"5-Candle Change: {analysis['price_change_5c']:+.2f}%")
-    print(f"ATR: ${analysis['atr']:.6f}")
-    print()
-    
-    print("🎯 SUPERBUYSELLTREND SIGNALS")
-    print("-" * 80)
-    print(f"Trend Level 1: {analysis['trend']}")
-    print(f"Trend Level 2: {analysis['trend_confirmed']}")
-    print(f"Alignment: {'✅ ALIGNED' if analysis['trend_aligned'] else '⚠️ NOT ALIGNED'}")
-    print(f"Current Buy Signal: {'🟢 YES' if analysis['current_buy_signal'] else 'No'}")
-    print(f"Current Sell Signal: {'🔴 YES' if analysis['current_sell_signal'] else 'No'}")
-    print(f"Buy Confirmed: {'🟢 YES' if analysis['current_buy_confirm'] else 'No'}")
-    print(f"Sell Confirmed: {'🔴 YES' if analysis['current_sell_confirm'] else 'No'}")
-    print()
-    
-    print("📈 TECHNICAL INDICATORS")
-    print("-" * 80)
-    print(f"RSI (14): {analysis['rsi']:.2f}")
-    print(f"MACD Histogram: {analysis['macd_hist']:.6f}")
-    print(f"ADX (14): {analysis['adx']:.2f}")
-    print(f"EMA 10: ${analysis['ema_10']:.6f}")
-    print(f"EMA 20: ${analysis['ema_20']:.6f}")
-    print()
-    
-    print("🎚️ SUPPORT/RESISTANCE LEVELS")
-    print("-" * 80)
-    print(f"Level 1 Support: ${analysis['up_level']:.6f}")
-    print(f"Level 1 Resistance: ${analysis['dn_level']:.6f}")
-    print(f"Level 2 Support: ${analysis['upx_level']:.6f}")
-    print(f"Level 2 Resistance: ${analysis['dnx_level']:.6f}")
-    print()
-    
-    print("🚦 TRADE SIGNAL")
-    print("=" * 80)
-    
+def format_analysis(analysis, signal):
+    """Format analysis and trade signal as a single string"""
+    out = []
+
+    out.append("📊 MARKET DATA")
+    out.append("-" * 80)
+    out.append(f"Price: ${analysis['price']:.6f}")
+    out.append(f"5-Candle Change: {analysis['price_change_5c']:+.2f}%")
+    out.append(f"ATR: ${analysis['atr']:.6f}")
+    out.append("")
+
+    out.append("🎯 SUPERBUYSELLTREND SIGNALS")
+    out.append("-" * 80)
+    out.append(f"Trend Level 1: {analysis['trend']}")
+    out.append(f"Trend Level 2: {analysis['trend_confirmed']}")
+    out.append(f"Alignment: {'✅ ALIGNED' if analysis['trend_aligned'] else '⚠️ NOT ALIGNED'}")
+    out.append(f"Current Buy Signal: {'🟢 YES' if analysis['current_buy_signal'] else 'No'}")
+    out.append(f"Current Sell Signal: {'🔴 YES' if analysis['current_sell_signal'] else 'No'}")
+    out.append(f"Buy Confirmed: {'🟢 YES' if analysis['current_buy_confirm'] else 'No'}")
+    out.append(f"Sell Confirmed: {'🔴 YES' if analysis['current_sell_confirm'] else 'No'}")
+    out.append("")
+
+    out.append("📈 TECHNICAL INDICATORS")
+    out.append("-" * 80)
+    out.append(f"RSI (14): {analysis['rsi']:.2f}")
+    out.append(f"MACD Histogram: {analysis['macd_hist']:.6f}")
+    out.append(f"ADX (14): {analysis['adx']:.2f}")
+    out.append(f"EMA 10: ${analysis['ema_10']:.6f}")
+    out.append(f"EMA 20: ${analysis['ema_20']:.6f}")
+    out.append("")
+
+    out.append("🎚️ SUPPORT/RESISTANCE LEVELS")
+    out.append("-" * 80)
+    out.append(f"Level 1 Support: ${analysis['up_level']:.6f}")
+    out.append(f"Level 1 Resistance: ${analysis['dn_level']:.6f}")
+    out.append(f"Level 2 Support: ${analysis['upx_level']:.6f}")
+    out.append(f"Level 2 Resistance: ${analysis['dnx_level']:.6f}")
+    out.append("")
+
+    out.append("🚦 TRADE SIGNAL")
+    out.append("=" * 80)
+
     if signal['action'] == 'BUY':
-        print(f"🟢 {signal['action']} | Confidence: {signal['confidence']}%")
+        out.append(f"🟢 {signal['action']} | Confidence: {signal['confidence']}%")
     elif signal['action'] == 'SELL':
-        print(f"🔴 {signal['action']} | Confidence: {signal['confidence']}%")
+        out.append(f"🔴 {signal['action']} | Confidence: {signal['confidence']}%")
     else:
-        print(f"⏸️  {signal['action']}")
-    
-    print()
-    print("Reasoning:")
+        out.append(f"⏸️  {signal['action']}")
+
+    out.append("")
+    out.append("Reasoning:")
     for reason in signal['reason']:
-        print(f"  {reason}")
-    
+        out.append(f"  {reason}")
+
     if signal['action'] in ['BUY', 'SELL']:
-        print()
-        print("📋 TRADE PLAN")
-        print("-" * 80)
-        print(f"Entry: ${signal['entry']:.6f}")
-        print(f"Stop Loss: ${signal['stop_loss']:.6f}")
-        print(f"Take Profit 1: ${signal['take_profit_1']:.6f} (Risk:Reward = 1:{signal['risk_reward']:.2f})")
-        print(f"Take Profit 2: ${signal['take_profit_2']:.6f}")
-        
+        out.append("")
+        out.append("📋 TRADE PLAN")
+        out.append("-" * 80)
+        out.append(f"Entry: ${signal['entry']:.6f}")
+        out.append(f"Stop Loss: ${signal['stop_loss']:.6f}")
+        out.append(f"Take Profit 1: ${signal['take_profit_1']:.6f} (Risk:Reward = 1:{signal['risk_reward']:.2f})")
+        out.append(f"Take Profit 2: ${signal['take_profit_2']:.6f}")
+
         risk_pct = abs((signal['stop_loss'] - signal['entry']) / signal['entry'] * 100)
-        print(f"\nRisk: {risk_pct:.2f}% | Recommended position size: Max 1-2% account risk")
-    
-    print()
+        out.append(f"\nRisk: {risk_pct:.2f}% | Recommended position size: Max 1-2% account risk")
+
+    out.append("")
+    return "\n".join(out)
+
+
+def print_analysis(analysis, signal):
+    """Print formatted analysis and trade signal"""
+    # One buffered write instead of ~40 print calls
+    sys.stdout.write(format_analysis(analysis, signal) + "\n")
 
 
 if __name__ == "__main__":
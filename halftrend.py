@@ -7,127 +7,187 @@ A trend-following indicator that uses ATR channels to identify reversals
 import pandas as pd
 import numpy as np
 import pandas_ta as ta
+from numba import njit, types
 
+# Inputs declared readonly: pandas .to_numpy() often hands out readonly views
+_RO_F8 = types.Array(types.float64, 1, 'C', readonly=True)
+_F8 = types.float64[:]
+_HALFTREND_SIG = types.Tuple((types.int64[:], _F8, _F8, _F8, _F8, _F8, _F8, _F8))(
+    _RO_F8, _RO_F8, _RO_F8, _RO_F8, types.int64, types.float64
+)
 
-def calculate_halftrend(df, amplitude=2, channel_deviation=2):
-    """
-    Calculate HalfTrend indicator
-    
-    Args:
-        df: DataFrame with OHLC data
-        amplitude: Lookback period for high/low extremes (default 2)
-        channel_deviation: ATR deviation multiplier (default 2)
-    
-    Returns:
-        DataFrame with added HalfTrend columns
+
+@njit(_HALFTREND_SIG, cache=True)
+def _halftrend_loop(high, low, close, atr2, amplitude, chan_dev):
+    """Jitted HalfTrend recurrence over raw float64 arrays.
+
+    Ports the per-bar Python loop verbatim: rolling high/low extremes and
+    means over the amplitude window, the trend/nextTrend state machine, and
+    the up/down channel levels. Rolling extremes come from monotonic index
+    deques (preallocated ring buffers, amortized O(1) per bar) and the
+    means from running sums, so the pass is strict O(n) regardless of
+    amplitude. fastmath is deliberately off: up/down/arrow arrays use NaN
+    sentinels.
     """
-    df = df.copy()
-    
-    # Calculate ATR
-    df['atr'] = ta.atr(df['High'], df['Low'], df['Close'], length=14)
-    atr2 = ta.atr(df['High'], df['Low'], df['Close'], length=100) / 2
-    
-    # Initialize arrays
-    n = len(df)
-    trend = np.zeros(n, dtype=int)
-    nextTrend = np.zeros(n, dtype=int)
-    maxLowPrice = np.zeros(n)
-    minHighPrice = np.zeros(n)
+    n = len(close)
+    trend = np.zeros(n, dtype=np.int64)
+    next_trend = np.zeros(n, dtype=np.int64)
+    max_low_price = np.zeros(n)
+    min_high_price = np.zeros(n)
     up = np.full(n, np.nan)
     down = np.full(n, np.nan)
-    atrHigh = np.zeros(n)
-    atrLow = np.zeros(n)
-    arrowUp = np.full(n, np.nan)
-    arrowDown = np.full(n, np.nan)
+    atr_high = np.zeros(n)
+    atr_low = np.zeros(n)
+    arrow_up = np.full(n, np.nan)
+    arrow_down = np.full(n, np.nan)
     ht = np.zeros(n)
-    
-    # Initial values
-    trend[0] = 0
-    nextTrend[0] = 0
-    maxLowPrice[0] = df['Low'].iloc[0]
-    minHighPrice[0] = df['High'].iloc[0]
-    
-    # Calculate HalfTrend
-    for i in range(amplitude, n):
-        # Get highest high and lowest low in amplitude period
-        high_period = df['High'].iloc[max(0, i-amplitude):i+1]
-        low_period = df['Low'].iloc[max(0, i-amplitude):i+1]
-        
-        highPrice = high_period.max()
-        lowPrice = low_period.min()
-        
-        highma = df['High'].iloc[max(0, i-amplitude):i+1].mean()
-        lowma = df['Low'].iloc[max(0, i-amplitude):i+1].mean()
-        
-        dev = channel_deviation * atr2.iloc[i]
-        
+
+    if n > 0:
+        max_low_price[0] = low[0]
+        min_high_price[0] = high[0]
+
+    # Monotonic index deques (ring buffers) for the rolling extremes plus
+    # running sums for the window means; window is the last amplitude+1 bars
+    maxq = np.empty(n, dtype=np.int64)
+    minq = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+    high_sum = 0.0
+    low_sum = 0.0
+    w = amplitude + 1
+
+    for i in range(n):
+        while max_tail > max_head and high[maxq[max_tail-1]] <= high[i]:
+            max_tail -= 1
+        maxq[max_tail] = i
+        max_tail += 1
+        if maxq[max_head] < i - amplitude:
+            max_head += 1
+
+        while min_tail > min_head and low[minq[min_tail-1]] >= low[i]:
+            min_tail -= 1
+        minq[min_tail] = i
+        min_tail += 1
+        if minq[min_head] < i - amplitude:
+            min_head += 1
+
+        high_sum += high[i]
+        low_sum += low[i]
+        if i >= w:
+            high_sum -= high[i - w]
+            low_sum -= low[i - w]
+
+        if i < amplitude:
+            continue
+
+        high_price = high[maxq[max_head]]
+        low_price = low[minq[min_head]]
+        highma = high_sum / w
+        lowma = low_sum / w
+
+        dev = chan_dev * atr2[i]
+
         # Trend logic
-        if nextTrend[i-1] == 1:
-            maxLowPrice[i] = max(lowPrice, maxLowPrice[i-1])
-            
-            if highma < maxLowPrice[i] and df['Close'].iloc[i] < df['Low'].iloc[i-1]:
+        if next_trend[i-1] == 1:
+            max_low_price[i] = max(low_price, max_low_price[i-1])
+
+            if highma < max_low_price[i] and close[i] < low[i-1]:
                 trend[i] = 1
-                nextTrend[i] = 0
-                minHighPrice[i] = highPrice
+                next_trend[i] = 0
+                min_high_price[i] = high_price
             else:
-                trend[i] = nextTrend[i-1]
-                nextTrend[i] = nextTrend[i-1]
-                minHighPrice[i] = minHighPrice[i-1]
-                maxLowPrice[i] = maxLowPrice[i-1]
+                trend[i] = next_trend[i-1]
+                next_trend[i] = next_trend[i-1]
+                min_high_price[i] = min_high_price[i-1]
+                max_low_price[i] = max_low_price[i-1]
         else:
-            minHighPrice[i] = min(highPrice, minHighPrice[i-1])
-            
-            if lowma > minHighPrice[i] and df['Close'].iloc[i] > df['High'].iloc[i-1]:
+            min_high_price[i] = min(high_price, min_high_price[i-1])
+
+            if lowma > min_high_price[i] and close[i] > high[i-1]:
                 trend[i] = 0
-                nextTrend[i] = 1
-                maxLowPrice[i] = lowPrice
+                next_trend[i] = 1
+                max_low_price[i] = low_price
             else:
-                trend[i] = nextTrend[i-1] if i == 0 else trend[i-1]
-                nextTrend[i] = nextTrend[i-1] if i == 0 else nextTrend[i-1]
-                minHighPrice[i] = minHighPrice[i-1]
-                maxLowPrice[i] = maxLowPrice[i-1]
-        
+                trend[i] = trend[i-1]
+                next_trend[i] = next_trend[i-1]
+                min_high_price[i] = min_high_price[i-1]
+                max_low_price[i] = max_low_price[i-1]
+
         # Calculate up/down levels
         if trend[i] == 0:
-            if i > 0 and trend[i-1] != 0:
-                up[i] = down[i-1] if not np.isnan(down[i-1]) else down[i-1]
-                arrowUp[i] = up[i] - atr2.iloc[i]
+            if trend[i-1] != 0:
+                up[i] = down[i-1]
+                arrow_up[i] = up[i] - atr2[i]
             else:
-                if i == 0 or np.isnan(up[i-1]):
-                    up[i] = maxLowPrice[i]
+                if np.isnan(up[i-1]):
+                    up[i] = max_low_price[i]
                 else:
-                    up[i] = max(maxLowPrice[i], up[i-1])
-            
-            atrHigh[i] = up[i] + dev
-            atrLow[i] = up[i] - dev
+                    up[i] = max(max_low_price[i], up[i-1])
+
+            atr_high[i] = up[i] + dev
+            atr_low[i] = up[i] - dev
             ht[i] = up[i]
         else:
-            if i > 0 and trend[i-1] != 1:
-                down[i] = up[i-1] if not np.isnan(up[i-1]) else up[i-1]
-                arrowDown[i] = down[i] + atr2.iloc[i]
+            if trend[i-1] != 1:
+                down[i] = up[i-1]
+                arrow_down[i] = down[i] + atr2[i]
             else:
-                if i == 0 or np.isnan(down[i-1]):
-                    down[i] = minHighPrice[i]
+                if np.isnan(down[i-1]):
+                    down[i] = min_high_price[i]
                 else:
-                    down[i] = min(minHighPrice[i], down[i-1])
-            
-            atrHigh[i] = down[i] + dev
-            atrLow[i] = down[i] - dev
+                    down[i] = min(min_high_price[i], down[i-1])
+
+            atr_high[i] = down[i] + dev
+            atr_low[i] = down[i] - dev
             ht[i] = down[i]
+
+    return trend, up, down, atr_high, atr_low, arrow_up, arrow_down, ht
+
+
+def calculate_halftrend(df, amplitude=2, channel_deviation=2):
+    """
+    Calculate HalfTrend indicator
     
-    # Detect signals
-    buySignal = np.zeros(n, dtype=bool)
-    sellSignal = np.zeros(n, dtype=bool)
+    Args:
+        df: DataFrame with OHLC data
+        amplitude: Lookback period for high/low extremes (default 2)
+        channel_deviation: ATR deviation multiplier (default 2)
     
-    for i in range(1, n):
-        # Buy signal: trend changes from 1 to 0 with arrow
-        if trend[i] == 0 and trend[i-1] == 1 and not np.isnan(arrowUp[i]):
-            buySignal[i] = True
-        
-        # Sell signal: trend changes from 0 to 1 with arrow
-        if trend[i] == 1 and trend[i-1] == 0 and not np.isnan(arrowDown[i]):
-            sellSignal[i] = True
+    Returns:
+        DataFrame with added HalfTrend columns
+    """
+    # Only new columns are ever assigned, so a shallow copy (axes only,
+    # shared data blocks) keeps the caller's frame unmodified without
+    # memcpying every column
+    df = df.copy(deep=False)
     
+    # Calculate ATR - skipped when the caller's pipeline (e.g. SBST)
+    # already attached an atr column; HalfTrend itself only consumes atr2
+    if 'atr' not in df.columns:
+        df['atr'] = ta.atr(df['High'], df['Low'], df['Close'], length=14)
+    atr2 = ta.atr(df['High'], df['Low'], df['Close'], length=100) / 2
+
+    # One-time extraction to contiguous float64 arrays, then the whole
+    # per-bar recurrence runs in the jitted kernel
+    n = len(df)
+    high_arr = df['High'].to_numpy(dtype=np.float64)
+    low_arr = df['Low'].to_numpy(dtype=np.float64)
+    close_arr = df['Close'].to_numpy(dtype=np.float64)
+    atr2_arr = atr2.to_numpy(dtype=np.float64)
+
+    trend, up, down, atrHigh, atrLow, arrowUp, arrowDown, ht = _halftrend_loop(
+        high_arr, low_arr, close_arr, atr2_arr, amplitude, float(channel_deviation)
+    )
+
+    # Detect signals: trend transitions with an arrow. Offset slices are
+    # views, so no shifted copy of the trend array is made; bar 0 has no
+    # previous trend and stays False.
+    buySignal = np.zeros(n, dtype=bool)
+    sellSignal = np.zeros(n, dtype=bool)
+    buySignal[1:] = (trend[1:] == 0) & (trend[:-1] == 1) & ~np.isnan(arrowUp[1:])
+    sellSignal[1:] = (trend[1:] == 1) & (trend[:-1] == 0) & ~np.isnan(arrowDown[1:])
+
+
     # Add to dataframe
     df['halftrend'] = ht
     df['halftrend_up'] = up
@@ -135,8 +195,8 @@ def calculate_halftrend(df, amplitude=2, channel_deviation=2):
     df['halftrend_atr_high'] = atrHigh
     df['halftrend_atr_low'] = atrLow
     df['halftrend_trend'] = trend
-    df['halftrend_buy_signal'] = buySignal
-    df['halftrend_sell_signal'] = sellSignal
+    df['halftrend_buy_signal'] = buySignal.astype(np.uint8)
+    df['halftrend_sell_signal'] = sellSignal.astype(np.uint8)
     
     return df
 
@@ -162,10 +222,10 @@ def get_halftrend_signals(symbol, period="6mo", amplitude=2, channel_deviation=2
         latest = df.iloc[-1]
         
         # Check for recent signals
-        recent_buy = df['halftrend_buy_signal'].iloc[-5:].any()
-        recent_sell = df['halftrend_sell_signal'].iloc[-5:].any()
-        current_buy = latest['halftrend_buy_signal']
-        current_sell = latest['halftrend_sell_signal']
+        recent_buy = bool(df['halftrend_buy_signal'].iloc[-5:].any())
+        recent_sell = bool(df['halftrend_sell_signal'].iloc[-5:].any())
+        current_buy = bool(latest['halftrend_buy_signal'])
+        current_sell = bool(latest['halftrend_sell_signal'])
         
         signals = {
             'symbol': symbol,
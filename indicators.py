@@ -2,26 +2,82 @@
 Custom Technical Indicators Module
 Replicates common Pine Script indicators in Python
 """
+import sys
+
 import yfinance as yf
 import pandas as pd
 import pandas_ta as ta
 import numpy as np
+from numba import njit, types
+
+# pandas .to_numpy() often hands out readonly views
+_RO_F8 = types.Array(types.float64, 1, 'C', readonly=True)
+
+
+def _sma_many(close, periods):
+    """All SMA windows from a single cumulative-sum pass over close."""
+    cs = np.cumsum(close)
+    n = len(close)
+    out = {}
+    for p in periods:
+        arr = np.full(n, np.nan)
+        if n >= p:
+            arr[p-1] = cs[p-1] / p
+            arr[p:] = (cs[p:] - cs[:-p]) / p
+        out[p] = arr
+    return out
+
+
+@njit(types.float64[:](_RO_F8, types.int64), cache=True)
+def _ema(x, period):
+    """SMA-seeded EMA recurrence (same convention as ta.ema)."""
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+    s = 0.0
+    for i in range(period):
+        s += x[i]
+    e = s / period
+    out[period-1] = e
+    alpha = 2.0 / (period + 1.0)
+    for i in range(period, n):
+        e += alpha * (x[i] - e)
+        out[i] = e
+    return out
+
+
+# Interned indicator column names shared by the hot lookup paths
+_RSI, _MACD, _MACDS, _MACDH, _ADX, _EMA10, _EMA20, _SMA50 = map(
+    sys.intern,
+    ('RSI', 'MACD_12_26_9', 'MACDs_12_26_9', 'MACDh_12_26_9',
+     'ADX_14', 'EMA_10', 'EMA_20', 'SMA_50'),
+)
+
+# Reused yf.Ticker objects - avoids rebuilding session state per call
+_TICKER_CACHE = {}
+
+# Indicator frames keyed by (symbol, period, last bar timestamp) - polling
+# callers skip the full recompute until a new bar closes
+_INDICATOR_CACHE = {}
 
 
 def get_price_data(symbol, period="6mo", interval="1d"):
     """
     Fetch historical price data for a symbol
-    
+
     Args:
         symbol: Stock ticker (e.g., 'AAPL')
         period: Data period ('1mo', '3mo', '6mo', '1y', '2y', '5y', 'max')
         interval: Data interval ('1d', '1h', '1wk', '1mo')
-    
+
     Returns:
         DataFrame with OHLCV data
     """
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = _TICKER_CACHE.get(symbol)
+        if ticker is None:
+            ticker = _TICKER_CACHE[symbol] = yf.Ticker(symbol)
         df = ticker.history(period=period, interval=interval)
         return df
     except Exception as e:
@@ -29,31 +85,159 @@ def get_price_data(symbol, period="6mo", interval="1d"):
         return None
 
 
+def get_price_data_batch(symbols, period="6mo", interval="1d"):
+    """
+    Fetch price data for many symbols with one threaded yf.download call
+
+    Returns:
+        Dict of symbol -> DataFrame (symbols with no data are omitted)
+    """
+    symbols = list(symbols)
+    try:
+        data = yf.download(tickers=symbols, period=period, interval=interval,
+                           group_by='ticker', threads=True, progress=False)
+    except Exception as e:
+        print(f"Error batch fetching {len(symbols)} symbols: {e}")
+        return {}
+
+    if data is None or data.empty:
+        return {}
+    if len(symbols) == 1:
+        return {symbols[0]: data}
+
+    result = {}
+    available = set(data.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol in available:
+            df = data[symbol].dropna(how='all')
+            if len(df):
+                result[symbol] = df
+    return result
+
+
+@njit(types.float64[:](_RO_F8, types.int64), cache=True)
+def _rsi(close, period):
+    """Wilder RSI: SMA-seeded average gain/loss, then the 1/period
+    smoothing recurrence. Warmup bars are NaN."""
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, period + 1):
+        change = close[i] - close[i-1]
+        if change > 0:
+            gain_sum += change
+        else:
+            loss_sum -= change
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
+    for i in range(period, n):
+        if i > period:
+            change = close[i] - close[i-1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0.0:
+            out[i] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(types.Tuple((types.float64[:], types.float64[:], types.float64[:]))(
+    _RO_F8, _RO_F8, _RO_F8, types.int64), cache=True)
+def _adx(high, low, close, period):
+    """Directional movement with Wilder smoothing.
+
+    Returns (adx, dmp, dmn); DI lines appear after `period` bars and ADX
+    after 2*period-1, mirroring the pandas_ta warmup shape.
+    """
+    n = len(close)
+    adx = np.full(n, np.nan)
+    dmp = np.full(n, np.nan)
+    dmn = np.full(n, np.nan)
+
+    str_ = 0.0
+    spdm = 0.0
+    smdm = 0.0
+    dx_sum = 0.0
+    adx_val = 0.0
+
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i-1])
+        lc = abs(low[i] - close[i-1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        up = high[i] - high[i-1]
+        dn = low[i-1] - low[i]
+        pdm = up if (up > dn and up > 0) else 0.0
+        mdm = dn if (dn > up and dn > 0) else 0.0
+
+        if i <= period:
+            str_ += tr
+            spdm += pdm
+            smdm += mdm
+        else:
+            str_ += tr - str_ / period
+            spdm += pdm - spdm / period
+            smdm += mdm - smdm / period
+
+        if i >= period and str_ > 0:
+            pdi = 100.0 * spdm / str_
+            mdi = 100.0 * smdm / str_
+            dmp[i] = pdi
+            dmn[i] = mdi
+            di_sum = pdi + mdi
+            dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0 else 0.0
+            if i < 2 * period - 1:
+                dx_sum += dx
+            elif i == 2 * period - 1:
+                adx_val = (dx_sum + dx) / period
+                adx[i] = adx_val
+            else:
+                adx_val = (adx_val * (period - 1) + dx) / period
+                adx[i] = adx_val
+
+    return adx, dmp, dmn
+
+
 def calculate_rsi(df, period=14):
     """Calculate RSI (Relative Strength Index)"""
-    df['RSI'] = ta.rsi(df['Close'], length=period)
+    df['RSI'] = _rsi(df['Close'].to_numpy(dtype=np.float64), period)
     return df
 
 
 def calculate_macd(df, fast=12, slow=26, signal=9):
     """Calculate MACD (Moving Average Convergence Divergence)"""
     macd = ta.macd(df['Close'], fast=fast, slow=slow, signal=signal)
-    df = pd.concat([df, macd], axis=1)
+    # Direct column assignment - skips the index realignment and block
+    # copies pd.concat performs
+    df[list(macd.columns)] = macd.to_numpy()
     return df
 
 
 def calculate_moving_averages(df, periods=[10, 20, 50, 200]):
     """Calculate multiple SMAs and EMAs"""
+    # One close extraction shared by every window; SMAs all derive from a
+    # single cumulative sum and EMAs run a jitted recurrence each
+    close = df['Close'].to_numpy(dtype=np.float64)
+    smas = _sma_many(close, periods)
     for period in periods:
-        df[f'SMA_{period}'] = ta.sma(df['Close'], length=period)
-        df[f'EMA_{period}'] = ta.ema(df['Close'], length=period)
+        df[f'SMA_{period}'] = smas[period]
+        df[f'EMA_{period}'] = _ema(close, period)
     return df
 
 
 def calculate_bollinger_bands(df, period=20, std=2):
     """Calculate Bollinger Bands"""
     bbands = ta.bbands(df['Close'], length=period, std=std)
-    df = pd.concat([df, bbands], axis=1)
+    df[list(bbands.columns)] = bbands.to_numpy()
     return df
 
 
@@ -72,8 +256,15 @@ def calculate_stochastic(df, k=14, d=3, smooth_k=3):
 
 def calculate_adx(df, period=14):
     """Calculate ADX (Average Directional Index)"""
-    adx = ta.adx(df['High'], df['Low'], df['Close'], length=period)
-    df = pd.concat([df, adx], axis=1)
+    adx, dmp, dmn = _adx(
+        df['High'].to_numpy(dtype=np.float64),
+        df['Low'].to_numpy(dtype=np.float64),
+        df['Close'].to_numpy(dtype=np.float64),
+        period,
+    )
+    df[f'ADX_{period}'] = adx
+    df[f'DMP_{period}'] = dmp
+    df[f'DMN_{period}'] = dmn
     return df
 
 
@@ -123,7 +314,13 @@ def calculate_all_indicators(symbol, period="6mo"):
     df = get_price_data(symbol, period=period)
     if df is None or len(df) < 200:
         return None
-    
+
+    # No new bar since the last call -> the indicator stack is unchanged
+    key = (symbol, period, df.index[-1])
+    cached = _INDICATOR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     # Calculate all indicators
     df = calculate_rsi(df)
     df = calculate_macd(df)
@@ -133,7 +330,10 @@ def calculate_all_indicators(symbol, period="6mo"):
     df = calculate_stochastic(df)
     df = calculate_adx(df)
     df = calculate_obv(df)
-    
+
+    if len(_INDICATOR_CACHE) >= 128:
+        _INDICATOR_CACHE.clear()
+    _INDICATOR_CACHE[key] = df
     return df
 
 
@@ -147,26 +347,27 @@ def get_latest_signals(symbol, period="6mo"):
     df = calculate_all_indicators(symbol, period=period)
     if df is None:
         return None
-    
-    latest = df.iloc[-1]
-    
+
+    # One row extraction; the ~20 field reads below hit a plain dict
+    latest = df.iloc[-1].to_dict()
+
     signals = {
         'symbol': symbol,
         'close': latest['Close'],
-        'rsi': latest.get('RSI'),
-        'macd': latest.get('MACD_12_26_9'),
-        'macd_signal': latest.get('MACDs_12_26_9'),
-        'macd_hist': latest.get('MACDh_12_26_9'),
-        'sma_50': latest.get('SMA_50'),
+        'rsi': latest.get(_RSI),
+        'macd': latest.get(_MACD),
+        'macd_signal': latest.get(_MACDS),
+        'macd_hist': latest.get(_MACDH),
+        'sma_50': latest.get(_SMA50),
         'sma_200': latest.get('SMA_200'),
-        'ema_10': latest.get('EMA_10'),
+        'ema_10': latest.get(_EMA10),
         'bb_upper': latest.get('BBU_20_2.0'),
         'bb_middle': latest.get('BBM_20_2.0'),
         'bb_lower': latest.get('BBL_20_2.0'),
         'atr': latest.get('ATR'),
         'stoch_k': latest.get('STOCHk_14_3_3'),
         'stoch_d': latest.get('STOCHd_14_3_3'),
-        'adx': latest.get('ADX_14'),
+        'adx': latest.get(_ADX),
         'obv': latest.get('OBV'),
         'golden_cross': golden_cross_check(df),
         'is_uptrend': is_uptrend(df),
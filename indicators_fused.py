@@ -0,0 +1,210 @@
+"""
+Fused Technical Indicators
+Single-pass Numba replacement for the backtester's indicator set
+
+Computes RSI(14), MACD(12,26,9), SMA/EMA 10/20/50 and ADX(14) in one loop
+over the OHLC arrays instead of one full pandas/pandas-ta pass per
+indicator. Warmup bars are NaN, matching the column layout the rest of the
+pipeline expects.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _compute_all(high, low, close):
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    macd = np.full(n, np.nan)
+    macds = np.full(n, np.nan)
+    macdh = np.full(n, np.nan)
+    sma10 = np.full(n, np.nan)
+    ema10 = np.full(n, np.nan)
+    sma20 = np.full(n, np.nan)
+    ema20 = np.full(n, np.nan)
+    sma50 = np.full(n, np.nan)
+    ema50 = np.full(n, np.nan)
+    adx = np.full(n, np.nan)
+
+    # RSI(14) state - Wilder smoothing seeded with the first 14 changes
+    rsi_p = 14
+    gain_sum = 0.0
+    loss_sum = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    # EMA state (SMA-seeded, talib convention)
+    e10 = e20 = e50 = 0.0
+    e12 = e26 = 0.0
+    a10 = 2.0 / 11.0
+    a20 = 2.0 / 21.0
+    a50 = 2.0 / 51.0
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+
+    # Running sums for SMA seeds/windows
+    s10 = s20 = s50 = 0.0
+
+    # MACD signal line state
+    sig = 0.0
+    sig_seed_sum = 0.0
+    sig_start = 25 + 8  # slow-1 + signal-1
+
+    # ADX(14) state - Wilder smoothed TR/+DM/-DM then RMA of DX
+    adx_p = 14
+    str_ = 0.0
+    spdm = 0.0
+    smdm = 0.0
+    dx_sum = 0.0
+    adx_val = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # --- moving averages (running-window sums + SMA-seeded EMAs)
+        s10 += c
+        s20 += c
+        s50 += c
+        if i >= 10:
+            s10 -= close[i - 10]
+        if i >= 20:
+            s20 -= close[i - 20]
+        if i >= 50:
+            s50 -= close[i - 50]
+        if i >= 9:
+            sma10[i] = s10 / 10.0
+            if i == 9:
+                e10 = sma10[i]
+            else:
+                e10 += a10 * (c - e10)
+            ema10[i] = e10
+        if i >= 19:
+            sma20[i] = s20 / 20.0
+            if i == 19:
+                e20 = sma20[i]
+            else:
+                e20 += a20 * (c - e20)
+            ema20[i] = e20
+        if i >= 49:
+            sma50[i] = s50 / 50.0
+            if i == 49:
+                e50 = sma50[i]
+            else:
+                e50 += a50 * (c - e50)
+            ema50[i] = e50
+
+        # --- MACD EMAs (seeded with the plain running means)
+        if i == 11:
+            e12 = s10 + close[i - 10] + close[i - 11]  # sum of first 12
+            e12 /= 12.0
+        elif i > 11:
+            e12 += a12 * (c - e12)
+        if i == 25:
+            e26 = 0.0
+            for j in range(26):
+                e26 += close[i - j]
+            e26 /= 26.0
+        elif i > 25:
+            e26 += a26 * (c - e26)
+        if i >= 25:
+            m = e12 - e26
+            macd[i] = m
+            if i < sig_start:
+                sig_seed_sum += m
+            if i == sig_start:
+                sig = (sig_seed_sum + m) / 9.0
+            elif i > sig_start:
+                sig += a9 * (m - sig)
+            if i >= sig_start:
+                macds[i] = sig
+                macdh[i] = m - sig
+
+        # --- RSI
+        if i > 0:
+            change = c - close[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if i <= rsi_p:
+                gain_sum += gain
+                loss_sum += loss
+                if i == rsi_p:
+                    avg_gain = gain_sum / rsi_p
+                    avg_loss = loss_sum / rsi_p
+            else:
+                avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+                avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+            if i >= rsi_p:
+                if avg_loss == 0.0:
+                    rsi[i] = 100.0 if avg_gain > 0 else 50.0
+                else:
+                    rs = avg_gain / avg_loss
+                    rsi[i] = 100.0 - 100.0 / (1.0 + rs)
+
+        # --- ADX (directional movement, Wilder smoothing)
+        if i > 0:
+            tr = high[i] - low[i]
+            hc = abs(high[i] - close[i - 1])
+            lc = abs(low[i] - close[i - 1])
+            if hc > tr:
+                tr = hc
+            if lc > tr:
+                tr = lc
+            up = high[i] - high[i - 1]
+            dn = low[i - 1] - low[i]
+            pdm = up if (up > dn and up > 0) else 0.0
+            mdm = dn if (dn > up and dn > 0) else 0.0
+
+            if i <= adx_p:
+                str_ += tr
+                spdm += pdm
+                smdm += mdm
+            else:
+                str_ += tr - str_ / adx_p
+                spdm += pdm - spdm / adx_p
+                smdm += mdm - smdm / adx_p
+
+            if i >= adx_p and str_ > 0:
+                pdi = 100.0 * spdm / str_
+                mdi = 100.0 * smdm / str_
+                di_sum = pdi + mdi
+                dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0 else 0.0
+                if i < 2 * adx_p - 1:
+                    dx_sum += dx
+                elif i == 2 * adx_p - 1:
+                    adx_val = (dx_sum + dx) / adx_p
+                    adx[i] = adx_val
+                else:
+                    adx_val = (adx_val * (adx_p - 1) + dx) / adx_p
+                    adx[i] = adx_val
+
+    return rsi, macd, macds, macdh, sma10, ema10, sma20, ema20, sma50, ema50, adx
+
+
+def compute_all(high, low, close):
+    """Compute the fused indicator set.
+
+    Args:
+        high, low, close: float64 ndarrays
+
+    Returns:
+        Dict of column name -> ndarray using the pandas_ta naming scheme
+    """
+    rsi, macd, macds, macdh, sma10, ema10, sma20, ema20, sma50, ema50, adx = _compute_all(
+        np.asarray(high, dtype=np.float64),
+        np.asarray(low, dtype=np.float64),
+        np.asarray(close, dtype=np.float64),
+    )
+    return {
+        'RSI': rsi,
+        'MACD_12_26_9': macd,
+        'MACDs_12_26_9': macds,
+        'MACDh_12_26_9': macdh,
+        'SMA_10': sma10,
+        'EMA_10': ema10,
+        'SMA_20': sma20,
+        'EMA_20': ema20,
+        'SMA_50': sma50,
+        'EMA_50': ema50,
+        'ADX_14': adx,
+    }
@@ -4,9 +4,22 @@ Notification helpers for multi-channel alerts.
 Supports Telegram, Discord, and Slack webhooks.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import Dict, Optional
 
+try:
+    # Optional HTTP/2 backend: one multiplexed TLS session covers bursts to
+    # the same host with no extra handshakes
+    import httpx
+except ImportError:
+    httpx = None
+
+log = logging.getLogger(__name__)
+
 
 class NotificationManager:
     """Send notifications across multiple channels."""
@@ -27,6 +40,48 @@ class NotificationManager:
         self.discord_enabled = bool(self.discord_webhook_url)
         self.slack_enabled = bool(self.slack_webhook_url)
 
+        # Prefer an HTTP/2 client (multiplexed connections); fall back to a
+        # pooled requests session, which still gives keep-alive reuse
+        self._client = None
+        self._session = None
+        if httpx is not None:
+            try:
+                self._client = httpx.Client(
+                    http2=True,
+                    timeout=10.0,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                )
+            except ImportError:
+                # httpx installed without the http2 extra (h2)
+                self._client = None
+        if self._client is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+
+    def _post(self, url, data=None, json=None):
+        if self._client is not None:
+            return self._client.post(url, data=data, json=json)
+        return self._session.post(url, data=data, json=json, timeout=10)
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        if self._client is not None:
+            self._client.close()
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self) -> "NotificationManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def enabled_channels(self) -> Dict[str, bool]:
         return {
             "telegram": self.telegram_enabled,
@@ -35,18 +90,25 @@ class NotificationManager:
         }
 
     def send(self, message: str) -> Dict[str, bool]:
-        results = {}
-
+        senders = []
         if self.telegram_enabled:
-            results["telegram"] = self._send_telegram(message)
-
+            senders.append(("telegram", self._send_telegram))
         if self.discord_enabled:
-            results["discord"] = self._send_discord(message)
-
+            senders.append(("discord", self._send_discord))
         if self.slack_enabled:
-            results["slack"] = self._send_slack(message)
+            senders.append(("slack", self._send_slack))
+
+        if not senders:
+            return {}
+        if len(senders) == 1:
+            name, fn = senders[0]
+            return {name: fn(message)}
 
-        return results
+        # Channels are independent HTTP endpoints - dispatch them together so
+        # total latency is the slowest channel, not the sum of all three
+        with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+            futures = {name: executor.submit(fn, message) for name, fn in senders}
+            return {name: future.result() for name, future in futures.items()}
 
     def _send_telegram(self, message: str) -> bool:
         try:
@@ -56,26 +118,26 @@ class NotificationManager:
                 "text": message,
                 "parse_mode": "HTML",
             }
-            response = requests.post(url, data=data, timeout=10)
+            response = self._post(url, data=data)
             return response.status_code == 200
         except Exception as exc:
-            print(f"❌ Telegram error: {exc}")
+            log.warning("Telegram send failed: %s", exc)
             return False
 
     def _send_discord(self, message: str) -> bool:
         try:
             data = {"content": message}
-            response = requests.post(self.discord_webhook_url, json=data, timeout=10)
+            response = self._post(self.discord_webhook_url, json=data)
             return response.status_code in {200, 204}
         except Exception as exc:
-            print(f"❌ Discord error: {exc}")
+            log.warning("Discord send failed: %s", exc)
             return False
 
     def _send_slack(self, message: str) -> bool:
         try:
             data = {"text": message}
-            response = requests.post(self.slack_webhook_url, json=data, timeout=10)
+            response = self._post(self.slack_webhook_url, json=data)
             return response.status_code == 200
         except Exception as exc:
-            print(f"❌ Slack error: {exc}")
+            log.warning("Slack send failed: %s", exc)
             return False
@@ -7,8 +7,8 @@ Supports both paper trading (simulation) and live trading
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
-from datetime import datetime
 import json
 from pathlib import Path
 
@@ -36,6 +36,10 @@ class OrderExecutor:
         self.paper_balance = 10000.0  # Starting paper balance
         self.paper_orders = []
         self.paper_positions = {}
+
+        # Last leverage successfully set per symbol - skips the redundant
+        # set_leverage round-trip when re-ordering at the same leverage
+        self._leverage_cache: Dict[str, int] = {}
         
         self.logger.info(f"OrderExecutor initialized in {self.mode.upper()} mode")
     
@@ -100,8 +104,9 @@ class OrderExecutor:
     ) -> Dict:
         """Simulate order placement for paper trading"""
         
-        # Generate order ID
-        order_id = f"PAPER_{int(time.time() * 1000)}"
+        # Generate order ID - monotonic clock is cheaper than gettimeofday
+        # and immune to wall-clock jumps
+        order_id = f"PAPER_{time.monotonic_ns()}"
         
         # Calculate order value
         position_value = quantity * entry_price
@@ -109,7 +114,7 @@ class OrderExecutor:
         
         # Check paper balance
         if margin_required > self.paper_balance:
-            self.logger.warning(f"Insufficient paper balance: {self.paper_balance:.2f} USDT")
+            self.logger.warning("Insufficient paper balance: %.2f USDT", self.paper_balance)
             return {
                 'success': False,
                 'error': 'Insufficient balance',
@@ -129,6 +134,9 @@ class OrderExecutor:
             'order_id': order_id,
             'symbol': symbol,
             'side': side,
+            # +1 long / -1 short, resolved once so P&L math never
+            # re-compares the side string
+            'side_sign': 1 if side == 'buy' else -1,
             'quantity': quantity,
             'entry_price': executed_price,
             'stop_loss': stop_loss,
@@ -137,7 +145,9 @@ class OrderExecutor:
             'position_value': position_value,
             'margin_used': margin_required,
             'status': 'filled',
-            'timestamp': datetime.now().isoformat(),
+            # Raw epoch nanoseconds; formatting an ISO string on every
+            # simulated order is deferred to whoever actually renders it
+            'timestamp_ns': time.time_ns(),
             'mode': 'paper',
             'metadata': metadata or {}
         }
@@ -149,9 +159,10 @@ class OrderExecutor:
         self.paper_orders.append(order)
         self.paper_positions[order_id] = order
         
+        # %-style args defer all formatting until a handler accepts the record
         self.logger.info(
-            f"📝 PAPER ORDER: {side.upper()} {quantity} {symbol} @ {executed_price:.6f} "
-            f"| SL: {stop_loss:.6f} | TP: {take_profit:.6f} | Leverage: {leverage}x"
+            "📝 PAPER ORDER: %s %s %s @ %.6f | SL: %.6f | TP: %.6f | Leverage: %dx",
+            side.upper(), quantity, symbol, executed_price, stop_loss, take_profit, leverage
         )
         
         return {
@@ -181,17 +192,19 @@ class OrderExecutor:
     ) -> Dict:
         """Place real order on Bybit"""
         
-        try:
-            # Convert symbol for linear perpetuals (BTC/USDT -> BTC/USDT:USDT)
-            # This is required for Bybit linear contracts
-            if ':' not in symbol and '/USDT' in symbol:
-                perpetual_symbol = f"{symbol}:USDT"
-            else:
-                perpetual_symbol = symbol
+        # Convert symbol for linear perpetuals (BTC/USDT -> BTC/USDT:USDT)
+        # This is required for Bybit linear contracts
+        if ':' not in symbol and '/USDT' in symbol:
+            perpetual_symbol = f"{symbol}:USDT"
+        else:
+            perpetual_symbol = symbol
 
-            # Set leverage first
-            self.exchange.set_leverage(leverage, perpetual_symbol)
-            self.logger.info(f"Set leverage to {leverage}x for {perpetual_symbol}")
+        try:
+            # Set leverage first (skipped when already at the requested value)
+            if self._leverage_cache.get(perpetual_symbol) != leverage:
+                self.exchange.set_leverage(leverage, perpetual_symbol)
+                self._leverage_cache[perpetual_symbol] = leverage
+                self.logger.info(f"Set leverage to {leverage}x for {perpetual_symbol}")
             
             # Place main order
             if self.order_type == 'market':
@@ -204,42 +217,22 @@ class OrderExecutor:
             filled_price = order.get('average') or order.get('price') or entry_price
             
             self.logger.info(f"Order placed: {order_id} | {side.upper()} {quantity} {perpetual_symbol} @ {filled_price}")
-            
-            # Place stop-loss order (Bybit format)
-            try:
-                sl_side = 'sell' if side == 'buy' else 'buy'
-                sl_order = self.exchange.create_order(
-                    symbol=perpetual_symbol,
-                    type='market',
-                    side=sl_side,
-                    amount=quantity,
-                    params={
-                        'triggerPrice': stop_loss,
-                        'triggerBy': 'LastPrice',
-                        'reduceOnly': True
-                    }
+
+            # Place stop-loss and take-profit concurrently - they are
+            # independent reduce-only orders, so post-fill wall clock is
+            # max(SL rtt, TP rtt) instead of their sum. Each keeps its own
+            # error handling; a failed exit never blocks the other.
+            exit_side = 'sell' if side == 'buy' else 'buy'
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                sl_future = executor.submit(
+                    self._place_stop_loss, perpetual_symbol, exit_side, quantity, stop_loss
                 )
-                self.logger.info(f"Stop-loss set at {stop_loss}")
-            except Exception as e:
-                self.logger.error(f"Failed to set stop-loss: {e}")
-                import traceback
-                self.logger.debug(traceback.format_exc())
-            
-            # Place take-profit order
-            try:
-                tp_side = 'sell' if side == 'buy' else 'buy'
-                tp_order = self.exchange.create_order(
-                    symbol=perpetual_symbol,
-                    type='limit',
-                    side=tp_side,
-                    amount=quantity,
-                    price=take_profit,
-                    params={'reduceOnly': True}
+                tp_future = executor.submit(
+                    self._place_take_profit, perpetual_symbol, exit_side, quantity, take_profit
                 )
-                self.logger.info(f"Take-profit set at {take_profit}")
-            except Exception as e:
-                self.logger.error(f"Failed to set take-profit: {e}")
-            
+                sl_future.result()
+                tp_future.result()
+
             return {
                 'success': True,
                 'order_id': order_id,
@@ -256,6 +249,9 @@ class OrderExecutor:
             
         except Exception as e:
             self.logger.error(f"Live order failed: {e}")
+            # Leverage may have been changed externally or rejected - force
+            # a fresh set_leverage on the next attempt
+            self._leverage_cache.pop(perpetual_symbol, None)
             return {
                 'success': False,
                 'error': str(e),
@@ -263,6 +259,41 @@ class OrderExecutor:
                 'side': side
             }
     
+    def _place_stop_loss(self, symbol: str, exit_side: str, quantity: float, stop_loss: float):
+        """Place a reduce-only stop-loss trigger order (Bybit format)"""
+        try:
+            self.exchange.create_order(
+                symbol=symbol,
+                type='market',
+                side=exit_side,
+                amount=quantity,
+                params={
+                    'triggerPrice': stop_loss,
+                    'triggerBy': 'LastPrice',
+                    'reduceOnly': True
+                }
+            )
+            self.logger.info(f"Stop-loss set at {stop_loss}")
+        except Exception as e:
+            self.logger.error(f"Failed to set stop-loss: {e}")
+            import traceback
+            self.logger.debug(traceback.format_exc())
+
+    def _place_take_profit(self, symbol: str, exit_side: str, quantity: float, take_profit: float):
+        """Place a reduce-only take-profit limit order"""
+        try:
+            self.exchange.create_order(
+                symbol=symbol,
+                type='limit',
+                side=exit_side,
+                amount=quantity,
+                price=take_profit,
+                params={'reduceOnly': True}
+            )
+            self.logger.info(f"Take-profit set at {take_profit}")
+        except Exception as e:
+            self.logger.error(f"Failed to set take-profit: {e}")
+
     def close_position(self, position_id: str, current_price: float, reason: str = 'manual') -> Dict:
         """
         Close an open position
@@ -298,11 +329,10 @@ class OrderExecutor:
         quantity = position['quantity']
         leverage = position['leverage']
         side = position['side']
-        
-        if side == 'buy':
-            pnl_per_unit = current_price - entry_price
-        else:
-            pnl_per_unit = entry_price - current_price
+        # Fall back to the string compare for positions loaded from old state
+        side_sign = position.get('side_sign') or (1 if side == 'buy' else -1)
+
+        pnl_per_unit = (current_price - entry_price) * side_sign
         
         pnl_usdt = (pnl_per_unit * quantity) * leverage
         pnl_percent = (pnl_per_unit / entry_price) * 100 * leverage
@@ -314,7 +344,7 @@ class OrderExecutor:
         # Mark position as closed
         position['status'] = 'closed'
         position['close_price'] = current_price
-        position['close_time'] = datetime.now().isoformat()
+        position['close_time_ns'] = time.time_ns()
         position['pnl'] = pnl_usdt
         position['pnl_percent'] = pnl_percent
         position['close_reason'] = reason
@@ -324,9 +354,8 @@ class OrderExecutor:
         
         emoji = "📈" if pnl_usdt >= 0 else "📉"
         self.logger.info(
-            f"{emoji} PAPER POSITION CLOSED: {position['symbol']} | "
-            f"P&L: {pnl_usdt:+.2f} USDT ({pnl_percent:+.2f}%) | "
-            f"Reason: {reason} | Balance: {self.paper_balance:.2f} USDT"
+            "%s PAPER POSITION CLOSED: %s | P&L: %+.2f USDT (%+.2f%%) | Reason: %s | Balance: %.2f USDT",
+            emoji, position['symbol'], pnl_usdt, pnl_percent, reason, self.paper_balance
         )
         
         return {
@@ -6,10 +6,24 @@ Standalone module for any trading bot - no exchange dependency
 
 import json
 import logging
+import os
 import time
-from datetime import datetime
+from collections import deque
+from itertools import islice
 from typing import Dict, Optional, List
 
+import numpy as np
+
+try:
+    # Optional fast JSON backend: serializes state several times faster
+    # than the stdlib and handles numpy scalars natively
+    import orjson
+except ImportError:
+    orjson = None
+
+# Completed orders kept in memory; older ones age out automatically
+_MAX_ORDER_HISTORY = 10_000
+
 
 class OrderExecutor:
     """Execute and manage paper trading orders"""
@@ -25,10 +39,30 @@ class OrderExecutor:
         self.logger = logging.getLogger(__name__)
         self.paper_balance = initial_balance
         self.min_trade_size = min_trade_size
-        self.paper_orders = []
+        self.paper_orders = deque(maxlen=_MAX_ORDER_HISTORY)
         self.paper_positions = {}
         self.slippage = 0.001  # 0.1% slippage
 
+        # SoA mirror of paper_positions for the vectorized TP/SL scan;
+        # rebuilt lazily whenever a position is opened or closed
+        self._pos_dirty = True
+        self._pos_ids = []
+        self._pos_symbols = []
+        self._pos_sl = np.empty(0)
+        self._pos_tp = np.empty(0)
+        self._pos_side = np.empty(0, dtype=np.int8)
+        self._pos_entry = np.empty(0)
+        self._pos_qty = np.empty(0)
+        self._pos_lev = np.empty(0)
+        self._pos_symbol_idx = np.empty(0, dtype=np.int64)
+
+        # Integer-indexed price table: symbols register an index on first
+        # sight, ticks write into the array via update_prices, and the scan
+        # gathers prices with one fancy-index load instead of hashing a
+        # symbol string per position
+        self._symbol_to_idx = {}
+        self._price_array = np.full(64, np.nan)
+
         self.logger.info(f"OrderExecutor initialized with ${initial_balance:.2f} balance")
 
     def open_position(
@@ -70,7 +104,8 @@ class OrderExecutor:
             # Check balance
             if margin_required > self.paper_balance:
                 self.logger.warning(
-                    f"Insufficient balance: need ${margin_required:.2f}, have ${self.paper_balance:.2f}"
+                    "Insufficient balance: need $%.2f, have $%.2f",
+                    margin_required, self.paper_balance
                 )
                 return None
 
@@ -78,14 +113,18 @@ class OrderExecutor:
             slippage_amount = entry_price * self.slippage
             executed_price = entry_price + slippage_amount if side == 'buy' else entry_price - slippage_amount
 
-            # Generate position ID
-            position_id = f"PAPER_{int(time.time() * 1000)}_{symbol.replace('/', '_')}"
+            # Generate position ID - monotonic clock is cheaper than
+            # gettimeofday and immune to wall-clock jumps
+            position_id = f"PAPER_{time.monotonic_ns()}_{symbol.replace('/', '_')}"
 
             # Create position
             position = {
                 'position_id': position_id,
                 'symbol': symbol,
                 'side': side,
+                # +1 long / -1 short, resolved once so P&L math never
+                # re-compares the side string
+                'side_sign': 1 if side == 'buy' else -1,
                 'quantity': quantity,
                 'entry_price': executed_price,
                 'stop_loss': stop_loss,
@@ -94,7 +133,9 @@ class OrderExecutor:
                 'position_value': position_size_usd,
                 'margin_used': margin_required,
                 'status': 'open',
-                'open_time': datetime.now().isoformat(),
+                # Raw epoch nanoseconds; ISO formatting is deferred to
+                # whoever renders the record
+                'open_time_ns': time.time_ns(),
                 'mode': 'paper'
             }
 
@@ -104,11 +145,15 @@ class OrderExecutor:
             # Store position
             self.paper_positions[position_id] = position
             self.paper_orders.append(position)
+            self._pos_dirty = True
 
+            # %-style args defer all formatting until a handler accepts
+            # the record
             self.logger.info(
-                f"📝 PAPER POSITION OPENED: {side.upper()} {quantity:.6f} {symbol} @ {executed_price:.6f} "
-                f"| SL: {stop_loss:.6f} | TP: {take_profit:.6f} | Leverage: {leverage}x | "
-                f"Balance: ${self.paper_balance:.2f}"
+                "📝 PAPER POSITION OPENED: %s %.6f %s @ %.6f | SL: %.6f | TP: %.6f "
+                "| Leverage: %dx | Balance: $%.2f",
+                side.upper(), quantity, symbol, executed_price, stop_loss,
+                take_profit, leverage, self.paper_balance
             )
 
             return position_id
@@ -131,7 +176,7 @@ class OrderExecutor:
         """
         try:
             if position_id not in self.paper_positions:
-                self.logger.warning(f"Position not found: {position_id}")
+                self.logger.warning("Position not found: %s", position_id)
                 return None
 
             position = self.paper_positions[position_id]
@@ -141,11 +186,11 @@ class OrderExecutor:
             quantity = position['quantity']
             leverage = position['leverage']
             side = position['side']
+            # Fall back to the string compare for positions loaded from
+            # old state
+            side_sign = position.get('side_sign') or (1 if side == 'buy' else -1)
 
-            if side == 'buy':
-                pnl_per_unit = close_price - entry_price
-            else:
-                pnl_per_unit = entry_price - close_price
+            pnl_per_unit = (close_price - entry_price) * side_sign
 
             pnl_usdt = (pnl_per_unit * quantity) * leverage
             pnl_percent = (pnl_per_unit / entry_price) * 100 * leverage
@@ -156,7 +201,7 @@ class OrderExecutor:
 
             # Update position
             position['close_price'] = close_price
-            position['close_time'] = datetime.now().isoformat()
+            position['close_time_ns'] = time.time_ns()
             position['pnl'] = pnl_usdt
             position['pnl_percent'] = pnl_percent
             position['close_reason'] = reason
@@ -164,12 +209,12 @@ class OrderExecutor:
 
             # Remove from active positions
             del self.paper_positions[position_id]
+            self._pos_dirty = True
 
             emoji = "📈" if pnl_usdt >= 0 else "📉"
             self.logger.info(
-                f"{emoji} PAPER POSITION CLOSED: {position['symbol']} | "
-                f"P&L: {pnl_usdt:+.2f} USDT ({pnl_percent:+.2f}%) | "
-                f"Reason: {reason} | Balance: ${self.paper_balance:.2f}"
+                "%s PAPER POSITION CLOSED: %s | P&L: %+.2f USDT (%+.2f%%) | Reason: %s | Balance: $%.2f",
+                emoji, position['symbol'], pnl_usdt, pnl_percent, reason, self.paper_balance
             )
 
             return {
@@ -190,67 +235,168 @@ class OrderExecutor:
         """Get all open positions"""
         return list(self.paper_positions.values())
 
+    def mark_to_market(self, current_prices: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Unrealized P&L of every open position in one vectorized pass
+
+        Args:
+            current_prices: Dictionary of symbol -> current price, or None
+                            to read the internal table fed by update_prices
+
+        Returns:
+            Array of P&L in USDT aligned with get_open_positions() order;
+            positions without a price mark as NaN
+        """
+        if not self.paper_positions:
+            return np.empty(0)
+
+        if self._pos_dirty:
+            self._rebuild_position_arrays()
+
+        prices = self._prices_for_positions(current_prices)
+
+        return (prices - self._pos_entry) * self._pos_side * self._pos_qty * self._pos_lev
+
     def get_balance(self) -> float:
         """Get current balance"""
         return self.paper_balance
 
-    def check_positions_for_close(self, current_prices: Dict[str, float]) -> List[Dict]:
+    def _symbol_index(self, symbol: str) -> int:
+        """Index of a symbol in the price table, registering it if new"""
+        idx = self._symbol_to_idx.get(symbol)
+        if idx is None:
+            idx = self._symbol_to_idx[symbol] = len(self._symbol_to_idx)
+            if idx >= len(self._price_array):
+                grown = np.full(len(self._price_array) * 2, np.nan)
+                grown[:len(self._price_array)] = self._price_array
+                self._price_array = grown
+        return idx
+
+    def update_prices(self, current_prices: Dict[str, float]):
+        """
+        Write fresh prices into the internal price table
+
+        Feed ticks through here and call check_positions_for_close() /
+        mark_to_market() with no argument to use the table directly.
+        """
+        for symbol, price in current_prices.items():
+            self._price_array[self._symbol_index(symbol)] = price
+
+    def _rebuild_position_arrays(self):
+        """Rebuild the SoA mirror of paper_positions (called lazily)"""
+        n = len(self.paper_positions)
+        ids = []
+        symbols = []
+        sl = np.empty(n)
+        tp = np.empty(n)
+        side = np.empty(n, dtype=np.int8)
+        entry = np.empty(n)
+        qty = np.empty(n)
+        lev = np.empty(n)
+        sym_idx = np.empty(n, dtype=np.int64)
+
+        for j, (position_id, position) in enumerate(self.paper_positions.items()):
+            ids.append(position_id)
+            symbols.append(position['symbol'])
+            sl[j] = position['stop_loss']
+            tp[j] = position['take_profit']
+            side[j] = position.get('side_sign') or (1 if position['side'] == 'buy' else -1)
+            entry[j] = position['entry_price']
+            qty[j] = position['quantity']
+            lev[j] = position['leverage']
+            # Resolved from the symbol (not a stored index) so positions
+            # loaded from state map into this process's table
+            sym_idx[j] = self._symbol_index(position['symbol'])
+
+        self._pos_ids = ids
+        self._pos_symbols = symbols
+        self._pos_sl = sl
+        self._pos_tp = tp
+        self._pos_side = side
+        self._pos_entry = entry
+        self._pos_qty = qty
+        self._pos_lev = lev
+        self._pos_symbol_idx = sym_idx
+        self._pos_dirty = False
+
+    def _prices_for_positions(self, current_prices: Optional[Dict[str, float]]) -> np.ndarray:
+        """Price per open position: one gather from the table, or NaN-mapped
+        lookups from an explicit dict"""
+        if current_prices is None:
+            return self._price_array[self._pos_symbol_idx]
+        n = len(self._pos_symbols)
+        return np.fromiter(
+            (current_prices.get(symbol, np.nan) for symbol in self._pos_symbols),
+            dtype=np.float64, count=n,
+        )
+
+    def check_positions_for_close(self, current_prices: Optional[Dict[str, float]] = None) -> List[Dict]:
         """
         Check all open positions against current prices for TP/SL hits
 
+        The comparisons run vectorized over SoA side-arrays mirroring
+        paper_positions, so a basket of hundreds of positions costs a few
+        NumPy array ops per tick instead of per-position Python dispatch.
+        The positions dict stays the source of truth; the arrays are only
+        rebuilt after an open or close.
+
         Args:
-            current_prices: Dictionary of symbol -> current price
+            current_prices: Dictionary of symbol -> current price, or None
+                            to read the internal table fed by update_prices
 
         Returns:
             List of closed positions
         """
-        closed_positions = []
+        if not self.paper_positions:
+            return []
 
-        for position_id, position in list(self.paper_positions.items()):
-            symbol = position['symbol']
+        if self._pos_dirty:
+            self._rebuild_position_arrays()
 
-            if symbol not in current_prices:
-                continue
+        # Symbols without a fresh price get NaN, and NaN compares False in
+        # every branch below, so they are skipped exactly like before
+        prices = self._prices_for_positions(current_prices)
 
-            current_price = current_prices[symbol]
-            side = position['side']
-            sl = position['stop_loss']
-            tp = position['take_profit']
-
-            # Check if TP or SL hit
-            close_reason = None
-
-            if side == 'buy':
-                if current_price <= sl:
-                    close_reason = 'sl_hit'
-                elif current_price >= tp:
-                    close_reason = 'tp_hit'
-            else:  # sell/short
-                if current_price >= sl:
-                    close_reason = 'sl_hit'
-                elif current_price <= tp:
-                    close_reason = 'tp_hit'
-
-            if close_reason:
-                result = self.close_position(position_id, current_price, close_reason)
-                if result:
-                    closed_positions.append(result)
+        is_long = self._pos_side == 1
+        sl_hit = np.where(is_long, prices <= self._pos_sl, prices >= self._pos_sl)
+        tp_hit = np.where(is_long, prices >= self._pos_tp, prices <= self._pos_tp)
+        hits = np.nonzero(sl_hit | tp_hit)[0]
+
+        closed_positions = []
+        for j in hits:
+            # SL takes priority when both trigger on the same tick
+            close_reason = 'sl_hit' if sl_hit[j] else 'tp_hit'
+            result = self.close_position(self._pos_ids[j], float(prices[j]), close_reason)
+            if result:
+                closed_positions.append(result)
 
         return closed_positions
 
     def save_state(self, filepath: str = 'order_executor_state.json'):
         """Save executor state to file"""
         try:
+            # Keep last 100 orders; islice walks from the tail offset without
+            # copying the whole deque
+            tail_start = max(0, len(self.paper_orders) - 100)
             state = {
                 'paper_balance': self.paper_balance,
                 'paper_positions': self.paper_positions,
-                'paper_orders': self.paper_orders[-100:]  # Keep last 100 orders
+                'paper_orders': list(islice(self.paper_orders, tail_start, None))
             }
 
-            with open(filepath, 'w') as f:
-                json.dump(state, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(state, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                data = json.dumps(state).encode()
+
+            # Write-then-rename keeps the state file intact if the process
+            # dies mid-write
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
 
-            self.logger.debug(f"State saved to {filepath}")
+            self.logger.debug("State saved to %s", filepath)
 
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
@@ -258,12 +404,14 @@ class OrderExecutor:
     def load_state(self, filepath: str = 'order_executor_state.json'):
         """Load executor state from file"""
         try:
-            with open(filepath, 'r') as f:
-                state = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            state = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             self.paper_balance = state.get('paper_balance', self.paper_balance)
             self.paper_positions = state.get('paper_positions', {})
-            self.paper_orders = state.get('paper_orders', [])
+            self.paper_orders = deque(state.get('paper_orders', []), maxlen=_MAX_ORDER_HISTORY)
+            self._pos_dirty = True
 
             self.logger.info(
                 f"State loaded: Balance=${self.paper_balance:.2f}, "
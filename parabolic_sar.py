@@ -6,64 +6,70 @@ Stop and Reverse indicator for identifying trend reversals
 """
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
+from numba import njit, types
 
+# Inputs declared readonly: pandas .to_numpy() often hands out readonly
+# views. Pinning the full signature compiles the kernel at import time
+# (once per process, served from cache afterwards) instead of on the
+# first call, so the first bar of a live session pays no JIT stall.
+_RO_F8 = types.Array(types.float64, 1, 'C', readonly=True)
+_PSAR_SIG = types.Tuple((
+    types.float64[:], types.float64[:], types.float64[:], types.boolean[:],
+    types.float64[:], types.float64[:], types.float64[:],
+))(_RO_F8, _RO_F8, types.float64, types.float64, types.float64)
 
-def calculate_parabolic_sar(df, start=0.02, increment=0.02, maximum=0.2):
-    """
-    Calculate Parabolic SAR indicator
-    
-    Args:
-        df: DataFrame with OHLC data
-        start: Initial SAR increment (default 0.02 = 2%)
-        increment: SAR acceleration factor (default 0.02)
-        maximum: Maximum SAR acceleration (default 0.2 = 20%)
-    
-    Returns:
-        DataFrame with added Parabolic SAR columns
+
+@njit(_PSAR_SIG, cache=True, fastmath=True)
+def _psar_loop(high, low, start, increment, maximum):
+    """Jitted Parabolic SAR recurrence over raw float64 arrays.
+
+    Ports the per-bar loop verbatim: SAR projection, the two-bar
+    clamp, acceleration-factor updates and the stop-and-reverse
+    branches. Bar i depends on bar i-1's state, so this stays a scalar
+    loop - the win comes from running it in native code instead of the
+    interpreter with pandas indexing.
     """
-    df = df.copy()
-    
-    n = len(df)
+    n = len(high)
     psar = np.zeros(n)
     psarl = np.zeros(n)  # SAR long
     psars = np.zeros(n)  # SAR short
-    bull = np.ones(n, dtype=bool)  # Bull trend
+    bull = np.ones(n, dtype=np.bool_)  # Bull trend
     af = np.full(n, start)  # Acceleration factor
     hp = np.zeros(n)  # High point
     lp = np.zeros(n)  # Low point
-    
-    # Initialize
-    psar[0] = df['Low'].iloc[0]
-    psarl[0] = df['Low'].iloc[0]
-    psars[0] = df['High'].iloc[0]
-    hp[0] = df['High'].iloc[0]
-    lp[0] = df['Low'].iloc[0]
-    
+
+    if n > 0:
+        psar[0] = low[0]
+        psarl[0] = low[0]
+        psars[0] = high[0]
+        hp[0] = high[0]
+        lp[0] = low[0]
+
     for i in range(1, n):
         if bull[i-1]:
             # In uptrend
             psar[i] = psarl[i-1] + af[i-1] * (hp[i-1] - psarl[i-1])
-            
+
             # SAR cannot be above the prior two lows
-            psar[i] = min(psar[i], df['Low'].iloc[i-1], df['Low'].iloc[i-2] if i >= 2 else df['Low'].iloc[i-1])
-            
+            lo2 = low[i-2] if i >= 2 else low[i-1]
+            psar[i] = min(psar[i], min(low[i-1], lo2))
+
             psarl[i] = psar[i]
-            
+
             # Update high point
-            if df['High'].iloc[i] > hp[i-1]:
-                hp[i] = df['High'].iloc[i]
+            if high[i] > hp[i-1]:
+                hp[i] = high[i]
                 af[i] = min(af[i-1] + increment, maximum)
             else:
                 hp[i] = hp[i-1]
                 af[i] = af[i-1]
-            
+
             # Check for reversal
-            if df['Low'].iloc[i] < psar[i]:
+            if low[i] < psar[i]:
                 bull[i] = False
                 psar[i] = hp[i-1]
                 psars[i] = hp[i-1]
-                lp[i] = df['Low'].iloc[i]
+                lp[i] = low[i]
                 af[i] = start
             else:
                 bull[i] = True
@@ -71,80 +77,138 @@ def calculate_parabolic_sar(df, start=0.02, increment=0.02, maximum=0.2):
         else:
             # In downtrend
             psar[i] = psars[i-1] - af[i-1] * (psars[i-1] - lp[i-1])
-            
+
             # SAR cannot be below the prior two highs
-            psar[i] = max(psar[i], df['High'].iloc[i-1], df['High'].iloc[i-2] if i >= 2 else df['High'].iloc[i-1])
-            
+            hi2 = high[i-2] if i >= 2 else high[i-1]
+            psar[i] = max(psar[i], max(high[i-1], hi2))
+
             psars[i] = psar[i]
-            
+
             # Update low point
-            if df['Low'].iloc[i] < lp[i-1]:
-                lp[i] = df['Low'].iloc[i]
+            if low[i] < lp[i-1]:
+                lp[i] = low[i]
                 af[i] = min(af[i-1] + increment, maximum)
             else:
                 lp[i] = lp[i-1]
                 af[i] = af[i-1]
-            
+
             # Check for reversal
-            if df['High'].iloc[i] > psar[i]:
+            if high[i] > psar[i]:
                 bull[i] = True
                 psar[i] = lp[i-1]
                 psarl[i] = lp[i-1]
-                hp[i] = df['High'].iloc[i]
+                hp[i] = high[i]
                 af[i] = start
             else:
                 bull[i] = False
                 hp[i] = hp[i-1]
+
+    return psar, psarl, psars, bull, af, hp, lp
+
+
+def calculate_parabolic_sar(df, start=0.02, increment=0.02, maximum=0.2):
+    """
+    Calculate Parabolic SAR indicator
     
-    # Detect signals
+    Args:
+        df: DataFrame with OHLC data
+        start: Initial SAR increment (default 0.02 = 2%)
+        increment: SAR acceleration factor (default 0.02)
+        maximum: Maximum SAR acceleration (default 0.2 = 20%)
+    
+    Returns:
+        DataFrame with added Parabolic SAR columns
+    """
+    # One-time extraction to contiguous float64 arrays, then the whole
+    # per-bar recurrence runs in the jitted kernel
+    n = len(df)
+    high_arr = df['High'].to_numpy(dtype=np.float64)
+    low_arr = df['Low'].to_numpy(dtype=np.float64)
+
+    psar, psarl, psars, bull, af, hp, lp = _psar_loop(
+        high_arr, low_arr, float(start), float(increment), float(maximum)
+    )
+
+    # Detect signals: direction flips between adjacent bars. Offset slices
+    # are views, so no shifted copy of the bull array is made; bar 0 has no
+    # previous bar and stays False.
     buySignal = np.zeros(n, dtype=bool)
     sellSignal = np.zeros(n, dtype=bool)
-    
-    for i in range(1, n):
-        # Buy signal: direction changes from short to long
-        if bull[i] and not bull[i-1]:
-            buySignal[i] = True
-        
-        # Sell signal: direction changes from long to short
-        if not bull[i] and bull[i-1]:
-            sellSignal[i] = True
-    
-    # Direction: 1 = long, -1 = short
+    buySignal[1:] = bull[1:] & ~bull[:-1]
+    sellSignal[1:] = ~bull[1:] & bull[:-1]
+
+    # Direction: 1 = long, -1 = short; a change is either kind of flip
     direction = np.where(bull, 1, -1)
-    direction_change = np.zeros(n, dtype=bool)
-    for i in range(1, n):
-        if direction[i] != direction[i-1]:
-            direction_change[i] = True
-    
-    # Add to dataframe
-    df['psar'] = psar
-    df['psar_trend'] = direction
-    df['psar_af'] = af
-    df['psar_buy_signal'] = buySignal
-    df['psar_sell_signal'] = sellSignal
-    df['psar_direction_change'] = direction_change
+    direction_change = buySignal | sellSignal
     
+    # One concat instead of a deep copy plus six column inserts: the
+    # indicator columns land in a single allocation and the caller's
+    # frame is never mutated, so the upfront df.copy() is gone too
+    new_cols = pd.DataFrame({
+        'psar': psar,
+        'psar_trend': direction,
+        'psar_af': af,
+        'psar_buy_signal': buySignal,
+        'psar_sell_signal': sellSignal,
+        'psar_direction_change': direction_change,
+    }, index=df.index)
+
+    return pd.concat([df, new_cols], axis=1)
+
+
+# Fetched history keyed by (symbol, period) with a short TTL, plus a
+# signals cache keyed on the indicator parameters and the last bar's
+# timestamp - repeated scans within the same bar become dict lookups
+# instead of a network round-trip and a full PSAR recompute
+_HISTORY_CACHE = {}
+_HISTORY_CACHE_MAX = 512
+_HISTORY_TTL_S = 60.0
+_SIGNALS_CACHE = {}
+_SIGNALS_CACHE_MAX = 512
+
+
+def _get_history(symbol, period):
+    """Fetch OHLCV history, reusing a recent result within the TTL"""
+    import time
+    import yfinance as yf
+
+    key = (symbol, period)
+    cached = _HISTORY_CACHE.get(key)
+    now = time.time()
+    if cached is not None and now - cached[0] < _HISTORY_TTL_S:
+        return cached[1]
+
+    df = yf.Ticker(symbol).history(period=period)
+    if len(_HISTORY_CACHE) >= _HISTORY_CACHE_MAX:
+        _HISTORY_CACHE.clear()
+    _HISTORY_CACHE[key] = (now, df)
     return df
 
 
 def get_parabolic_sar_signals(symbol, period="6mo", start=0.02, increment=0.02, maximum=0.2):
     """
     Get Parabolic SAR signals for a symbol
-    
+
     Returns:
         Dict with latest Parabolic SAR data
     """
-    import yfinance as yf
-    
     try:
-        ticker = yf.Ticker(symbol)
-        df = ticker.history(period=period)
-        
+        df = _get_history(symbol, period)
+
         if len(df) < 10:
             return None
-        
+
+        # Keyed on the last bar: a new bar (or fresh history after the
+        # TTL) changes the key and naturally invalidates the entry
+        cache_key = (symbol, period, start, increment, maximum, df.index[-1])
+        cached = _SIGNALS_CACHE.get(cache_key)
+        if cached is not None:
+            # Hand out a copy so callers mutating their dict cannot
+            # corrupt the cached entry
+            return dict(cached)
+
         df = calculate_parabolic_sar(df, start=start, increment=increment, maximum=maximum)
-        
+
         latest = df.iloc[-1]
         
         # Check for recent signals
@@ -167,9 +231,13 @@ def get_parabolic_sar_signals(symbol, period="6mo", start=0.02, increment=0.02,
             'psar_distance': latest['Close'] - latest['psar'],
             'psar_distance_pct': ((latest['Close'] - latest['psar']) / latest['psar'] * 100) if latest['psar'] != 0 else 0,
         }
-        
-        return signals
-        
+
+        if len(_SIGNALS_CACHE) >= _SIGNALS_CACHE_MAX:
+            _SIGNALS_CACHE.clear()
+        _SIGNALS_CACHE[cache_key] = signals
+
+        return dict(signals)
+
     except Exception as e:
         print(f"Error calculating Parabolic SAR for {symbol}: {e}")
         return None
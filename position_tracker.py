@@ -5,11 +5,25 @@ Tracks open positions, calculates PnL, monitors daily limits
 """
 
 import logging
+import os
+import time
+from collections import deque
 from typing import Dict, List, Optional
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import json
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hard cap on retained closed trades per day; a deque with maxlen drops
+# the oldest entry in O(1) instead of growing without bound
+_MAX_DAILY_TRADES = 10_000
+
 
 class PositionTracker:
     """Track and manage trading positions"""
@@ -22,10 +36,28 @@ class PositionTracker:
         
         # State tracking
         self.open_positions: Dict[str, Dict] = {}
-        self.daily_trades: List[Dict] = []
+        # Reverse index symbol -> position_id so per-symbol lookups on the
+        # tick path are O(1) instead of scanning every open position
+        self._symbol_index: Dict[str, str] = {}
+        # SoA mirror of open_positions for the vectorized price update;
+        # rebuilt lazily whenever a position is added or closed
+        self._pos_dirty = True
+        self._pos_ids: List[str] = []
+        self._pos_symbols: List[str] = []
+        self._pos_entry = np.empty(0)
+        self._pos_qty = np.empty(0)
+        self._pos_lev = np.empty(0)
+        self._pos_side_sign = np.empty(0)
+        self._pos_sl = np.empty(0)
+        self._pos_tp = np.empty(0)
+        self.daily_trades = deque(maxlen=_MAX_DAILY_TRADES)
         self.daily_pnl = 0.0
         self.current_date = date.today()
-        
+        # Epoch timestamp of the next local midnight: the per-tick
+        # new-day check is then a single clock read and float compare
+        # instead of constructing a fresh date object on every call
+        self._next_day_ts = self._compute_next_day_ts()
+
         # Statistics
         self.total_trades = 0
         self.winning_trades = 0
@@ -53,6 +85,8 @@ class PositionTracker:
                 'position_id': position_id,
                 'symbol': order_result['symbol'],
                 'side': order_result['side'],
+                # +1 for long, -1 for short: lets P&L math run branchless
+                'side_sign': 1.0 if order_result['side'] == 'buy' else -1.0,
                 'quantity': order_result['quantity'],
                 'entry_price': order_result['executed_price'],
                 'stop_loss': order_result['stop_loss'],
@@ -66,6 +100,8 @@ class PositionTracker:
             }
             
             self.open_positions[position_id] = position
+            self._symbol_index[position['symbol']] = position_id
+            self._pos_dirty = True
             self.logger.info(f"Position added: {position_id} | {position['symbol']}")
             
             return True
@@ -102,13 +138,11 @@ class PositionTracker:
             entry_price = position['entry_price']
             quantity = position['quantity']
             leverage = position['leverage']
-            side = position['side']
-            
-            if side == 'buy':
-                pnl_per_unit = close_price - entry_price
-            else:
-                pnl_per_unit = entry_price - close_price
-            
+            # Branchless sign flip; fall back to the side string for
+            # positions persisted before side_sign existed
+            side_sign = position.get('side_sign') or (1.0 if position['side'] == 'buy' else -1.0)
+            pnl_per_unit = side_sign * (close_price - entry_price)
+
             pnl_usdt = (pnl_per_unit * quantity) * leverage
             pnl_percent = (pnl_per_unit / entry_price) * 100 * leverage
             
@@ -135,6 +169,9 @@ class PositionTracker:
             
             # Remove from open positions
             del self.open_positions[position_id]
+            if self._symbol_index.get(position['symbol']) == position_id:
+                del self._symbol_index[position['symbol']]
+            self._pos_dirty = True
             
             self.logger.info(
                 f"Position closed: {position_id} | "
@@ -163,14 +200,17 @@ class PositionTracker:
                 'open_count': len(self.open_positions)
             }
         
-        # Check daily loss limit
-        daily_loss_check = self.check_daily_loss_limit(account_balance=10000)  # Will be updated with real balance
-        if daily_loss_check['limit_exceeded']:
-            return {
-                'allowed': False,
-                'reason': f"Daily loss limit exceeded: {daily_loss_check['daily_loss']:.2f} USDT",
-                'daily_pnl': self.daily_pnl
-            }
+        # Check daily loss limit; with a flat or positive day there is no
+        # loss to exceed, so only the (cheap) day-rollover check runs
+        self._check_new_day()
+        if self.daily_pnl < 0:
+            daily_loss_check = self.check_daily_loss_limit(account_balance=10000)  # Will be updated with real balance
+            if daily_loss_check['limit_exceeded']:
+                return {
+                    'allowed': False,
+                    'reason': f"Daily loss limit exceeded: {daily_loss_check['daily_loss']:.2f} USDT",
+                    'daily_pnl': self.daily_pnl
+                }
         
         return {
             'allowed': True,
@@ -208,56 +248,88 @@ class PositionTracker:
     
     def get_position_by_symbol(self, symbol: str) -> Optional[Dict]:
         """Get open position for a symbol"""
-        for position in self.open_positions.values():
-            if position['symbol'] == symbol:
-                return position
-        return None
-    
+        position_id = self._symbol_index.get(symbol)
+        return self.open_positions.get(position_id) if position_id else None
+
     def has_open_position_for_symbol(self, symbol: str) -> bool:
         """Check if there's an open position for a symbol"""
-        return self.get_position_by_symbol(symbol) is not None
+        return symbol in self._symbol_index
     
+    def _rebuild_position_arrays(self):
+        """Rebuild the SoA mirror of open_positions (called lazily)"""
+        n = len(self.open_positions)
+        ids = []
+        symbols = []
+        entry = np.empty(n)
+        qty = np.empty(n)
+        lev = np.empty(n)
+        side_sign = np.empty(n)
+        sl = np.empty(n)
+        tp = np.empty(n)
+
+        for j, (position_id, position) in enumerate(self.open_positions.items()):
+            ids.append(position_id)
+            symbols.append(position['symbol'])
+            entry[j] = position['entry_price']
+            qty[j] = position['quantity']
+            lev[j] = position['leverage']
+            side_sign[j] = position.get('side_sign') or (1.0 if position['side'] == 'buy' else -1.0)
+            sl[j] = position['stop_loss']
+            tp[j] = position['take_profit']
+
+        self._pos_ids = ids
+        self._pos_symbols = symbols
+        self._pos_entry = entry
+        self._pos_qty = qty
+        self._pos_lev = lev
+        self._pos_side_sign = side_sign
+        self._pos_sl = sl
+        self._pos_tp = tp
+        self._pos_dirty = False
+
     def update_position_prices(self, current_prices: Dict[str, float]):
         """
         Update unrealized P&L for all open positions
-        
+
+        The P&L arithmetic and SL/TP comparisons run vectorized over SoA
+        side-arrays mirroring open_positions; only the per-position dict
+        writes remain scalar. The sign trick makes the comparisons
+        branchless: side_sign * (price - level) folds the buy and sell
+        cases into one expression.
+
         Args:
             current_prices: Dictionary of symbol -> current price
         """
-        for position_id, position in self.open_positions.items():
-            symbol = position['symbol']
-            if symbol in current_prices:
-                current_price = current_prices[symbol]
-                
-                # Calculate unrealized P&L
-                entry_price = position['entry_price']
-                quantity = position['quantity']
-                leverage = position['leverage']
-                side = position['side']
-                
-                if side == 'buy':
-                    pnl_per_unit = current_price - entry_price
-                else:
-                    pnl_per_unit = entry_price - current_price
-                
-                unrealized_pnl = (pnl_per_unit * quantity) * leverage
-                unrealized_pnl_pct = (pnl_per_unit / entry_price) * 100 * leverage
-                
-                position['current_price'] = current_price
-                position['unrealized_pnl'] = unrealized_pnl
-                position['unrealized_pnl_percent'] = unrealized_pnl_pct
-                
-                # Check if stop-loss or take-profit hit
-                if side == 'buy':
-                    if current_price <= position['stop_loss']:
-                        position['sl_hit'] = True
-                    elif current_price >= position['take_profit']:
-                        position['tp_hit'] = True
-                else:
-                    if current_price >= position['stop_loss']:
-                        position['sl_hit'] = True
-                    elif current_price <= position['take_profit']:
-                        position['tp_hit'] = True
+        # Common idle state: nothing open, nothing to do
+        if not self.open_positions:
+            return
+
+        if self._pos_dirty:
+            self._rebuild_position_arrays()
+
+        n = len(self._pos_symbols)
+        cur = np.fromiter(
+            (current_prices.get(symbol, np.nan) for symbol in self._pos_symbols),
+            dtype=np.float64, count=n,
+        )
+
+        pnl_per_unit = self._pos_side_sign * (cur - self._pos_entry)
+        unrealized = pnl_per_unit * self._pos_qty * self._pos_lev
+        unrealized_pct = (pnl_per_unit / self._pos_entry) * 100 * self._pos_lev
+        sl_hit = self._pos_side_sign * (cur - self._pos_sl) <= 0
+        tp_hit = ~sl_hit & (self._pos_side_sign * (cur - self._pos_tp) >= 0)
+
+        # NaN (no fresh price) compares False everywhere, so those
+        # positions are skipped exactly like before
+        for j in np.nonzero(~np.isnan(cur))[0]:
+            position = self.open_positions[self._pos_ids[j]]
+            position['current_price'] = cur[j]
+            position['unrealized_pnl'] = unrealized[j]
+            position['unrealized_pnl_percent'] = unrealized_pct[j]
+            if sl_hit[j]:
+                position['sl_hit'] = True
+            elif tp_hit[j]:
+                position['tp_hit'] = True
     
     def get_statistics(self) -> Dict:
         """Get trading statistics"""
@@ -293,17 +365,27 @@ class PositionTracker:
         self._check_new_day()
         self.daily_pnl += pnl
     
+    def _compute_next_day_ts(self) -> float:
+        """Epoch timestamp of the first instant after current_date"""
+        next_midnight = datetime.combine(self.current_date + timedelta(days=1), datetime.min.time())
+        return next_midnight.timestamp()
+
     def _check_new_day(self):
         """Reset daily stats if new day"""
+        # Fast path: still on the same day, nothing to do
+        if time.time() < self._next_day_ts:
+            return
+
         today = date.today()
         if today != self.current_date:
             self.logger.info(
-                f"New day started. Previous day P&L: {self.daily_pnl:.2f} USDT, "
-                f"Trades: {len(self.daily_trades)}"
+                "New day started. Previous day P&L: %.2f USDT, Trades: %d",
+                self.daily_pnl, len(self.daily_trades),
             )
             self.current_date = today
             self.daily_pnl = 0.0
-            self.daily_trades = []
+            self.daily_trades.clear()
+        self._next_day_ts = self._compute_next_day_ts()
     
     def save_state(self, filepath: str = 'position_state.json'):
         """Save tracker state to file"""
@@ -315,13 +397,24 @@ class PositionTracker:
                 'total_trades': self.total_trades,
                 'winning_trades': self.winning_trades,
                 'losing_trades': self.losing_trades,
-                'daily_trades': self.daily_trades
+                'daily_trades': list(self.daily_trades)
             }
-            
-            with open(filepath, 'w') as f:
-                json.dump(state, f, indent=2)
-            
-            self.logger.debug(f"State saved to {filepath}")
+
+            # Compact output either way: the file is machine-read on
+            # restart, so pretty-printed indentation only costs bytes
+            if orjson is not None:
+                data = orjson.dumps(state, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                data = json.dumps(state, separators=(',', ':')).encode()
+
+            # Write-then-rename keeps the state file intact if the process
+            # dies mid-write
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
+
+            self.logger.debug("State saved to %s", filepath)
             
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
@@ -332,16 +425,24 @@ class PositionTracker:
             if not Path(filepath).exists():
                 return False
             
-            with open(filepath, 'r') as f:
-                state = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            state = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             self.open_positions = state.get('open_positions', {})
+            # Rebuild the symbol index rather than persisting it
+            self._symbol_index = {
+                position['symbol']: position_id
+                for position_id, position in self.open_positions.items()
+            }
+            self._pos_dirty = True
             self.daily_pnl = state.get('daily_pnl', 0.0)
             self.current_date = date.fromisoformat(state.get('current_date', date.today().isoformat()))
+            self._next_day_ts = self._compute_next_day_ts()
             self.total_trades = state.get('total_trades', 0)
             self.winning_trades = state.get('winning_trades', 0)
             self.losing_trades = state.get('losing_trades', 0)
-            self.daily_trades = state.get('daily_trades', [])
+            self.daily_trades = deque(state.get('daily_trades', []), maxlen=_MAX_DAILY_TRADES)
             
             self.logger.info(f"State loaded from {filepath}")
             return True
@@ -81,8 +81,10 @@ def calculate_super_buy_sell_trend(df, periods=10, multiplier1=0.8, multiplier2=
     df['dn_level'] = dn_values
     
     # Buy/Sell signals
-    df['buy_signal'] = (df['trend'] == 1) & (df['trend'].shift(1) == -1)
-    df['sell_signal'] = (df['trend'] == -1) & (df['trend'].shift(1) == 1)
+    # Stored as uint8 rather than bool: same truthiness, SIMD-friendly for
+    # batch any()/sum() scans across many symbols
+    df['buy_signal'] = ((df['trend'] == 1) & (df['trend'].shift(1) == -1)).astype(np.uint8)
+    df['sell_signal'] = ((df['trend'] == -1) & (df['trend'].shift(1) == 1)).astype(np.uint8)
     
     # === LEVEL 2: Confirmation Signals (Multiplier 2) ===
     df['upx'] = df['src'] - multiplier2 * df['atr']
@@ -125,8 +127,8 @@ def calculate_super_buy_sell_trend(df, periods=10, multiplier1=0.8, multiplier2=
     df['dnx_level'] = dnx_values
     
     # Confirmation signals
-    df['buy_confirm'] = (df['trendx'] == 1) & (df['trendx'].shift(1) == -1)
-    df['sell_confirm'] = (df['trendx'] == -1) & (df['trendx'].shift(1) == 1)
+    df['buy_confirm'] = ((df['trendx'] == 1) & (df['trendx'].shift(1) == -1)).astype(np.uint8)
+    df['sell_confirm'] = ((df['trendx'] == -1) & (df['trendx'].shift(1) == 1)).astype(np.uint8)
     
     return df
 
@@ -150,10 +152,10 @@ def get_latest_sbst_signals(symbol, period="6mo", periods=10, multiplier1=0.8, m
         latest = df.iloc[-1]
         
         # Check for recent signals (last 5 days)
-        recent_buy = df['buy_signal'].iloc[-5:].any()
-        recent_sell = df['sell_signal'].iloc[-5:].any()
-        recent_buy_confirm = df['buy_confirm'].iloc[-5:].any()
-        recent_sell_confirm = df['sell_confirm'].iloc[-5:].any()
+        recent_buy = bool(df['buy_signal'].iloc[-5:].any())
+        recent_sell = bool(df['sell_signal'].iloc[-5:].any())
+        recent_buy_confirm = bool(df['buy_confirm'].iloc[-5:].any())
+        recent_sell_confirm = bool(df['sell_confirm'].iloc[-5:].any())
         
         signals = {
             'symbol': symbol,